@@ -27,6 +27,16 @@ def test_user_raw():
             assert c
 
 
+def test_from_packets_buffer():
+    size = Color.c_packet_size
+    buffer = ctypes.create_string_buffer(size * 2)
+    with Color('red') as red, Color('blue') as blue:
+        ctypes.memmove(buffer, red.raw, size)
+        ctypes.memmove(ctypes.byref(buffer, size), blue.raw, size)
+        colors = Color.from_packets_buffer(buffer, 2)
+        assert colors == [red, blue]
+
+
 def test_user_pickle():
     with Color('black') as black:
         # Can't trust string literal between IM versions, but the tuple
@@ -1,6 +1,8 @@
 #
 # These test cover the Image methods that directly map to C-API function calls.
 #
+import array
+import ctypes
 import io
 import warnings
 
@@ -324,7 +326,9 @@ def test_color_map(fx_asset):
         img.type = 'palette'
         assert img[0, 0] == img.color_map(0)
         orange = Color('ORANGE')
+        was = img.signature
         assert orange == img.color_map(0, orange)
+        assert was != img.signature
         assert orange == img.color_map(0, 'ORANGE')
         assert orange == img.color_map(0)
         with raises(TypeError):
@@ -833,6 +837,26 @@ def test_export_pixels():
             img.export_pixels(storage='NaN')
 
 
+def test_export_pixels_storage():
+    with Image(width=2, height=1, background=Color('white')) as img:
+        data = img.export_pixels(channel_map='RGB', storage='short')
+        assert data == [0xFFFF] * 6
+        data = img.export_pixels(channel_map='RGB', storage='double')
+        assert isinstance(data, list)
+        assert data == [1.0] * 6
+
+
+def test_export_pixels_memoryview():
+    with Image(width=3, height=2, background=Color('white')) as img:
+        view = img.export_pixels(channel_map='RGB', storage='short',
+                                 as_memoryview=True)
+        assert isinstance(view, memoryview)
+        assert view.shape == (2, 3, 3)
+        assert view.format == 'H'
+        assert view[1, 2, 0] == 0xFFFF
+        assert bytes(view) == array.array('H', [0xFFFF] * 18).tobytes()
+
+
 def test_export_pixels_issue_413():
     x = 10
     y = 10
@@ -1120,6 +1144,32 @@ def test_import_pixels():
             dst.import_pixels(data=[0x00, 0xFF])
 
 
+def test_import_pixels_buffer():
+    data = array.array('B', [0xFF, 0x00, 0x00] * 4)
+    with Image(width=2, height=2, background=Color('BLACK')) as dst:
+        dst.import_pixels(channel_map='RGB', storage='char', data=data)
+        assert dst[1, 1] == Color('RED')
+        dst.import_pixels(channel_map='RGB', storage='char',
+                          data=bytes([0x00, 0x00, 0xFF] * 4))
+        assert dst[0, 0] == Color('BLUE')
+        # Each byte is still one value with wider storage types.
+        dst.import_pixels(channel_map='RGB', storage='short',
+                          data=bytearray([0xFF, 0x00, 0x00] * 4))
+        assert dst.export_pixels(channel_map='RGB',
+                                 storage='short') == [0xFF, 0, 0] * 4
+        data = array.array('f', [0.0, 1.0, 0.0] * 4)
+        dst.import_pixels(channel_map='RGB', storage='float', data=data)
+        assert dst[1, 0] == Color('LIME')
+        # Multi-dimensional buffers are read in C order.
+        data = array.array('B', [0x00, 0x00, 0xFF] * 4)
+        dst.import_pixels(channel_map='RGB', storage='char',
+                          data=memoryview(data).cast('B', (2, 6)))
+        assert dst[0, 1] == Color('BLUE')
+        data = (ctypes.c_ubyte * 12)(*([0xFF, 0x00, 0x00] * 4))
+        dst.import_pixels(channel_map='RGB', storage='char', data=data)
+        assert dst[1, 1] == Color('RED')
+
+
 def test_import_pixels_issue_413():
     x = 10
     y = 10
@@ -1554,8 +1604,10 @@ def test_normalize():
 def test_normalize_channel():
     with Image(width=100, height=100, pseudo='rose:') as img:
         was = img.signature
+        green = img[10, 10].green
         img.normalize('red')
         assert was != img.signature
+        assert img[10, 10].green == green
 
 
 def test_oil_paint():
@@ -7,6 +7,7 @@ import numbers
 from pytest import raises
 
 from wand.color import Color
+from wand.drawing import Drawing
 from wand.font import Font
 from wand.image import Image
 from wand.version import MAGICK_VERSION_NUMBER
@@ -85,6 +86,20 @@ def test_channel_images():
         assert img.channel_images['red'] != img.channel_images['blue']
 
 
+def test_channel_images_extract_raw():
+    with Image(width=4, height=2, pseudo='xc:red') as img:
+        red = img.channel_images.extract_channel_raw('red')
+        assert red.shape == (2, 4)
+        assert red[0, 0] == 255
+        assert red[1, 3] == 255
+        blue = img.channel_images.extract_channel_raw('blue')
+        assert blue[1, 3] == 0
+        with raises(ValueError):
+            img.channel_images.extract_channel_raw('sync_channels')
+        with raises(ValueError):
+            img.channel_images.extract_channel_raw('purple')
+
+
 def test_colors():
     with Image(filename='rose:') as img:
         assert img.colors == 3019
@@ -167,6 +182,16 @@ def test_dispose(fx_asset):
         assert img.dispose == 'background'
 
 
+def test_font_color_independent():
+    with Image(width=1, height=1) as img:
+        img.font_color = 'gold'
+        first = img.font_color
+        first.alpha = 0.0
+        second = img.font_color
+        assert first is not second
+        assert second == Color('gold')
+
+
 def test_font_set(fx_asset):
     with Image(width=144, height=192, background=Color('#1e50a2')) as img:
         font = Font(
@@ -263,6 +288,17 @@ def test_histogram():
         assert h[Color('srgb(0,0,255)')] == 1
 
 
+def test_histogram_colorspace():
+    with Image(width=1, height=1, background=Color('white')) as img:
+        img.transform_colorspace('cmyk')
+        h = img.histogram
+        assert len(h) == 1
+        cmyk_white = list(h)[0]
+        assert h[cmyk_white] == 1
+        # Same quanta as CMYK white, but in another colorspace.
+        assert Color('black') not in h
+
+
 def test_interlace_scheme_get():
     with Image(filename='rose:') as img:
         expected = 'no'
@@ -340,6 +376,15 @@ def test_metadata(fx_asset):
         assert img.metadata.get('exif:UnknownValue', "IDK") == "IDK"
 
 
+def test_metadata_live():
+    with Image(filename='rose:') as img:
+        assert 'signature' not in list(img.metadata)
+        # The library stores the signature as an image property.
+        assert img.signature
+        assert 'signature' in list(img.metadata)
+        assert len(img.metadata) == len(list(img.metadata))
+
+
 def test_mimetype():
     """Gets mimetypes of the image."""
     with Image(filename='rose:') as img:
@@ -506,6 +551,23 @@ def test_signature():
         assert img.signature
 
 
+def test_signature_cache():
+    with Image(filename='rose:') as img:
+        original = img.signature
+        assert img.signature == original
+        img[0, 0] = 'white'
+        changed = img.signature
+        assert changed != original
+        img.negate()
+        assert img.signature != changed
+        with Drawing() as draw:
+            draw.fill_color = 'black'
+            draw.rectangle(left=0, top=0, width=10, height=10)
+            before = img.signature
+            draw(img)
+        assert img.signature != before
+
+
 def test_size():
     """Gets the image size."""
     with Image(filename='rose:') as img:
@@ -2,6 +2,7 @@
 # These tests cover the basic I/O & pythonic interfaces of the Image class.
 #
 import codecs
+import ctypes
 import io
 import os
 import os.path
@@ -92,6 +93,14 @@ def test_clear_image():
         assert img.size == (480, 640)
 
 
+def test_clear_blank_signature():
+    with Image(width=8, height=8, background='red') as img:
+        signature = img.signature
+        img.clear()
+        img.blank(8, 8, background='blue')
+        assert img.signature != signature
+
+
 def test_read_from_filename(fx_asset):
     fpath = str(fx_asset.joinpath('mona-lisa.jpg'))
     with Image() as img:
@@ -436,6 +445,15 @@ def test_iterate(fx_asset):
                 assert i == 299
 
 
+def test_iterate_raw():
+    with Image(filename='rose:') as img:
+        iterator = iter(img)
+        row = iterator.__next__(raw=True)
+        assert row.shape == (img.width, iterator.c_packet_size)
+        color = Color(raw=ctypes.create_string_buffer(row[0].tobytes()))
+        assert color == img[0, 0]
+
+
 def test_slice_clone():
     """Clones using slicing."""
     with Image(filename='rose:') as img:
@@ -509,6 +527,43 @@ def test_index_pixel_set():
             img[0.5, "d"] = Color('black')
 
 
+def test_index_pixel_set_slice():
+    with Image(filename='rose:') as img:
+        with Color('black') as dot:
+            img[10:20, 5:8] = dot
+            assert img[10, 5] == dot
+            assert img[19, 7] == dot
+            assert img[20, 7] != dot
+            assert img[10, 8] != dot
+            img[-1, :] = dot
+            assert img[69, 0] == dot
+            assert img[69, 45] == dot
+        with raises(ValueError):
+            img[::2, 0] = 'black'
+
+
+def test_index_pixel_set_slice_bands():
+    # Large enough to be filled in several bands of rows.
+    with Image(width=300, height=301, background='white') as img:
+        img[5:295, 1:300] = 'red'
+        assert img[5, 1] == Color('red')
+        assert img[294, 299] == Color('red')
+        assert img[150, 150] == Color('red')
+        assert img[150, 300] == Color('white')
+        assert img[4, 150] == Color('white')
+
+
+def test_index_pixel_set_after_resize():
+    with Image(width=2, height=2, background='white') as img:
+        img[1, 1] = 'red'
+        img.resize(4, 4)
+        img[3, 3] = 'blue'
+        assert img[3, 3] == Color('blue')
+        img.alpha_channel = True
+        img[0, 0] = 'transparent'
+        assert img[0, 0].alpha == 0.0
+
+
 def test_index_row(fx_asset):
     """Gets a row."""
     with Color('transparent') as transparent:
@@ -568,6 +623,10 @@ def test_equal(fx_asset):
         with Image(width=10, height=10, pseudo='plasma:') as b:
             assert a != b
             assert not (a == b)
+        assert a == a
+    with Image(width=10, height=5, pseudo='xc:orange') as c:
+        with Image(width=5, height=10, pseudo='xc:orange') as d:
+            assert c != d
 
 
 def test_object_hash(fx_asset):
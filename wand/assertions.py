@@ -10,6 +10,10 @@ This module checks user input before calling MagickWands C-API methods.
 import numbers
 from collections.abc import Sequence
 
+#: (:class:`tuple`) Built-in types checked before falling back to the much
+#: slower :class:`numbers.Real` ABC, e.g. for NumPy scalars.
+_REAL_TYPES = (int, float)
+
 
 def assert_bool(**kwargs):
     """Ensure all given values are boolean.
@@ -63,7 +67,8 @@ def assert_integer(**kwargs):
     .. versionadded:: 0.5.4
     """
     for label, subject in kwargs.items():
-        if not isinstance(subject, numbers.Integral):
+        if not (isinstance(subject, int) or
+                isinstance(subject, numbers.Integral)):
             fmt = "{0} must be an integer, not {1}"
             msg = fmt.format(label, repr(subject))
             raise TypeError(msg)
@@ -77,7 +82,8 @@ def assert_real(**kwargs):
     .. versionadded:: 0.5.4
     """
     for label, subject in kwargs.items():
-        if not isinstance(subject, numbers.Real):
+        if not (isinstance(subject, _REAL_TYPES) or
+                isinstance(subject, numbers.Real)):
             fmt = "{0} must be a real number, not {1}"
             msg = fmt.format(label, repr(subject))
             raise TypeError(msg)
@@ -115,11 +121,13 @@ def assert_coordinate(**kwargs):
             fmt = "'{0}' must be a exactly 2 real numbers, not {1}"
             msg = fmt.format(label, len(subject))
             raise ValueError(msg)
-        elif not isinstance(subject[0], numbers.Real):
+        elif not (isinstance(subject[0], _REAL_TYPES) or
+                  isinstance(subject[0], numbers.Real)):
             fmt = "first entry of '{0}' must be a real number, not {1}"
             msg = fmt.format(label, repr(subject[0]))
             raise TypeError(msg)
-        elif not isinstance(subject[1], numbers.Real):
+        elif not (isinstance(subject[1], _REAL_TYPES) or
+                  isinstance(subject[1], numbers.Real)):
             fmt = "second entry of '{0}' must be a real number, not {1}"
             msg = fmt.format(label, repr(subject[1]))
             raise TypeError(msg)
@@ -343,10 +343,12 @@ def load(lib, IM_VERSION):
         lib.MagickEqualizeImageChannel.argtypes = [c_void_p, c_int]
         lib.MagickEqualizeImageChannel.restype = c_bool
     lib.MagickEvaluateImage.argtypes = [c_void_p, c_int, c_double]
+    lib.MagickEvaluateImage.restype = c_bool
     if is_im_6:
         lib.MagickEvaluateImageChannel.argtypes = [
             c_void_p, c_int, c_int, c_double
         ]
+        lib.MagickEvaluateImageChannel.restype = c_bool
     else:
         lib.MagickEvaluateImageChannel = None
     lib.MagickEvaluateImages.argtypes = [c_void_p, c_int]
@@ -86,6 +86,14 @@ class Color(Resource):
 
     __slots__ = 'raw', 'c_resource', 'allocated'
 
+    #: (:class:`numbers.Integral`) The size of the pixel structure held
+    #: by :attr:`raw`.
+    #:
+    #: .. versionadded:: 0.7.0
+    c_packet_size = ctypes.sizeof(
+        MagickPixelPacket if MAGICK_VERSION_NUMBER < 0x700 else PixelInfo
+    )
+
     def __init__(self, string=None, raw=None):
         if (string is None and raw is None or
                 string is not None and raw is not None):
@@ -307,6 +315,29 @@ class Color(Resource):
         library.PixelGetMagickColor(pixelwand, raw_buffer)
         return cls(raw=raw_buffer)
 
+    @classmethod
+    def from_packets_buffer(cls, buffer, count):
+        """Creates many colors at once from a contiguous buffer of pixel
+        structures, e.g. one filled by :c:func:`PixelGetMagickColor` for
+        a whole row of pixels.  Each color refers to its own slice of
+        the ``buffer`` rather than a copy of it.
+
+        :param buffer: writable buffer of ``count`` pixel structures,
+                       each :attr:`c_packet_size` bytes long
+        :type buffer: :class:`ctypes.Array`, :class:`bytearray`
+        :param count: the number of colors to create
+        :type count: :class:`numbers.Integral`
+        :returns: a list of new colors
+        :rtype: :class:`list`
+
+        .. versionadded:: 0.7.0
+
+        """
+        stride = cls.c_packet_size
+        packet_type = ctypes.c_char * stride
+        return [cls(raw=packet_type.from_buffer(buffer, i * stride))
+                for i in range(count)]
+
     @property
     def alpha(self):
         """(:class:`numbers.Real`) Alpha value, from 0.0 to 1.0."""
@@ -1108,8 +1108,10 @@ class Drawing(Resource):
             library.MagickSetIteratorIndex(image.container.wand, image.index)
             res = library.MagickDrawImage(image.container.wand, self.resource)
             library.MagickSetIteratorIndex(image.container.wand, previous)
+            image.container._touch()
         else:
             res = library.MagickDrawImage(image.wand, self.resource)
+        image._touch()
         if not res:
             self.raise_exception()
 
@@ -10,9 +10,11 @@ error happened)::
         print('height =', i.height)
 
 """
+import array
 import ctypes
 import functools
 import numbers
+import threading
 import weakref
 from collections import abc
 from io import RawIOBase
@@ -21,14 +23,15 @@ from . import assertions
 from .api import libc, libmagick, library
 from .cdefs.structures import (AffineMatrix, CCObjectInfo, CCObjectInfo70A,
                                CCObjectInfo710, ChannelFeature, GeometryInfo,
-                               PixelInfo, RectangleInfo)
+                               MagickPixelPacket, PixelInfo, RectangleInfo)
 from .color import Color
 from .compat import binary, encode_filename, text, to_bytes
 from .exceptions import (MissingDelegateError, WandException,
                          WandLibraryVersionError, WandRuntimeError)
 from .font import Font
-from .resource import DestroyedResourceError, Resource, genesis
-from .version import MAGICK_HDRI, MAGICK_VERSION_NUMBER
+from .resource import (DestroyedResourceError, Resource, allocate_ref,
+                       deallocate_ref, genesis)
+from .version import MAGICK_HDRI, MAGICK_VERSION_NUMBER, QUANTUM_RANGE
 
 __all__ = ('ALPHA_CHANNEL_TYPES', 'AUTO_THRESHOLD_METHODS', 'CHANNELS',
            'COLORSPACE_TYPES', 'COMPARE_METRICS', 'COMPOSITE_OPERATORS',
@@ -46,6 +49,24 @@ __all__ = ('ALPHA_CHANNEL_TYPES', 'AUTO_THRESHOLD_METHODS', 'CHANNELS',
            'ArtifactTree', 'ProfileDict', 'ConnectedComponentObject')
 
 
+class _Index(dict):
+    """Maps each name of an enumeration table to its position, and raises
+    :exc:`ValueError` for unknown names just as :meth:`tuple.index()`
+    does.  It avoids a linear scan of the table on every lookup.
+
+    .. versionadded:: 0.7.0
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, table):
+        super().__init__((name, i) for i, name in enumerate(table))
+
+    def __missing__(self, name):
+        raise ValueError('{0!r} is not in tuple'.format(name))
+
+
 #: (:class:`tuple`) The list of :attr:`~wand.image.BaseImage.alpha_channel`
 #: types.
 #:
@@ -81,6 +102,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
                            'copy', 'deactivate', 'discrete', 'disassociate',
                            'extract', 'off', 'on', 'opaque', 'remove', 'set',
                            'shape', 'transparent')
+_ALPHA_CHANNEL_TYPES_IDX = _Index(ALPHA_CHANNEL_TYPES)
 
 
 #: (:class:`tuple`) The list of methods used by
@@ -93,6 +115,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
 #:
 #: .. versionadded:: 0.5.5
 AUTO_THRESHOLD_METHODS = ('undefined', 'kapur', 'otsu', 'triangle')
+_AUTO_THRESHOLD_METHODS_IDX = _Index(AUTO_THRESHOLD_METHODS)
 
 
 #: (:class:`dict`) The dictionary of channel types.
@@ -125,18 +148,28 @@ AUTO_THRESHOLD_METHODS = ('undefined', 'kapur', 'otsu', 'triangle')
 #:    Deprecated ``true_alpha``, ``rgb_channels``, and ``gray_channels``
 #:    values in favor of MagickCore channel parser.
 #:
-CHANNELS = dict(undefined=0, red=1, gray=1, cyan=1, green=2, magenta=2,
-                blue=4, yellow=4, alpha=8, opacity=8, black=32, index=32,
-                composite_channels=47, all_channels=134217727, true_alpha=64,
-                rgb=7, rgb_channels=7, gray_channels=1, sync_channels=256,
-                default_channels=134217719)
-if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
-    CHANNELS = dict(undefined=0, red=1, gray=1, cyan=1, green=2, magenta=2,
-                    blue=4, yellow=4, black=8, alpha=16, opacity=16, index=32,
-                    readmask=0x0040, write_mask=128, meta=256,
-                    composite_channels=31, all_channels=134217727,
-                    true_alpha=256, rgb=7, rgb_channels=7, gray_channels=1,
-                    sync_channels=131072, default_channels=134217727)
+CHANNELS = (
+    dict(undefined=0, red=1, gray=1, cyan=1, green=2, magenta=2,
+         blue=4, yellow=4, alpha=8, opacity=8, black=32, index=32,
+         composite_channels=47, all_channels=134217727, true_alpha=64,
+         rgb=7, rgb_channels=7, gray_channels=1, sync_channels=256,
+         default_channels=134217719)
+    if MAGICK_VERSION_NUMBER < 0x700 else
+    dict(undefined=0, red=1, gray=1, cyan=1, green=2, magenta=2,
+         blue=4, yellow=4, black=8, alpha=16, opacity=16, index=32,
+         readmask=0x0040, write_mask=128, meta=256,
+         composite_channels=31, all_channels=134217727,
+         true_alpha=256, rgb=7, rgb_channels=7, gray_channels=1,
+         sync_channels=131072, default_channels=134217727)
+)
+
+#: (:class:`dict`) Bit-masks of channel strings in ImageMagick's CLI format
+#: that have already been resolved by :c:func:`ParseChannelOption`.
+#: It's cleared once it holds 256 entries, so arbitrary strings can't
+#: grow it without bound.
+#:
+#: .. versionadded:: 0.7.0
+_PARSED_CHANNEL_MASKS = {}
 
 
 #: (:class:`tuple`) The list of colorspaces.
@@ -238,6 +271,8 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
                        'peak_signal_to_noise_ratio', 'perceptual_hash',
                        'root_mean_square', 'structural_similarity',
                        'structural_dissimilarity')
+_COLORSPACE_TYPES_IDX = _Index(COLORSPACE_TYPES)
+_COMPARE_METRICS_IDX = _Index(COMPARE_METRICS)
 
 
 #: (:class:`tuple`) The list of complex operators used by
@@ -255,6 +290,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
 #: .. versionadded:: 0.5.5
 COMPLEX_OPERATORS = ('undefined', 'add', 'conjugate', 'divide', 'magnitude',
                      'multiply', 'real_imaginary', 'subtract')
+_COMPLEX_OPERATORS_IDX = _Index(COMPLEX_OPERATORS)
 
 
 #: (:class:`tuple`) The list of composition operators
@@ -401,6 +437,9 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
         'stereo', 'freeze', 'interpolate', 'negate', 'reflect', 'soft_burn',
         'soft_dodge', 'stamp', 'rmse', 'saliency_blend', 'seamless_blend'
     )
+_COMPOSITE_OPERATORS_IDX = _Index(COMPOSITE_OPERATORS)
+_COMPOSITE_OVER = _COMPOSITE_OPERATORS_IDX['over']
+
 
 #: (:class:`tuple`) The list of :attr:`Image.compression` types.
 #:
@@ -442,6 +481,8 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
         'group4', 'jbig1', 'jbig2', 'jpeg2000', 'jpeg', 'losslessjpeg',
         'lzma', 'lzw', 'no', 'piz', 'pxr24', 'rle', 'zip', 'zips'
     )
+_COMPRESSION_TYPES_IDX = _Index(COMPRESSION_TYPES)
+
 
 #: (:class:`tuple`) The list of :attr:`BaseImage.dispose` types.
 #:
@@ -457,6 +498,7 @@ DISPOSE_TYPES = (
     'background',
     'previous'
 )
+_DISPOSE_TYPES_IDX = _Index(DISPOSE_TYPES)
 
 
 #: (:class:`tuple`) The list of :meth:`BaseImage.distort` methods.
@@ -490,6 +532,7 @@ DISTORTION_METHODS = (
     'cylinder_2_plane', 'plane_2_cylinder', 'barrel', 'barrel_inverse',
     'shepards', 'resize', 'sentinel', 'rigidaffine'
 )
+_DISTORTION_METHODS_IDX = _Index(DISTORTION_METHODS)
 
 
 #: (:class:`tuple`) The list of Dither methods. Used by
@@ -503,6 +546,7 @@ DISTORTION_METHODS = (
 #:
 #: .. versionadded:: 0.5.0
 DITHER_METHODS = ('undefined', 'no', 'riemersma', 'floyd_steinberg')
+_DITHER_METHODS_IDX = _Index(DITHER_METHODS)
 
 
 #: (:class:`tuple`) The list of evaluation operators. Used by
@@ -565,6 +609,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
                     'set', 'sine', 'subtract', 'sum', 'thresholdblack',
                     'threshold', 'thresholdwhite', 'uniformnoise', 'xor',
                     'inverse_log')
+_EVALUATE_OPS_IDX = _Index(EVALUATE_OPS)
 
 
 #: (:class:`tuple`) The list of filter types. Used by
@@ -616,6 +661,7 @@ FILTER_TYPES = ('undefined', 'point', 'box', 'triangle', 'hermite', 'hanning',
                 'welsh', 'parzen', 'bohman', 'bartlett', 'lagrange', 'lanczos',
                 'lanczossharp', 'lanczos2', 'lanczos2sharp', 'robidoux',
                 'robidouxsharp', 'cosine', 'spline', 'sentinel')
+_FILTER_TYPES_IDX = _Index(FILTER_TYPES)
 
 
 #: (:class:`tuple`) The list of :attr:`Image.function <BaseImage.function>`
@@ -630,6 +676,7 @@ FUNCTION_TYPES = ('undefined', 'polynomial', 'sinusoid', 'arcsin', 'arctan')
 if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
     FUNCTION_TYPES = ('undefined', 'arcsin', 'arctan', 'polynomial',
                       'sinusoid')
+_FUNCTION_TYPES_IDX = _Index(FUNCTION_TYPES)
 
 
 #: (:class:`tuple`) The list of :attr:`~BaseImage.gravity` types.
@@ -649,6 +696,19 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
 GRAVITY_TYPES = ('forget', 'north_west', 'north', 'north_east', 'west',
                  'center', 'east', 'south_west', 'south', 'south_east',
                  'static')
+_GRAVITY_TYPES_IDX = _Index(GRAVITY_TYPES)
+
+#: (:class:`dict`) The vertical & horizontal alignment of each
+#: :const:`GRAVITY_TYPES` entry, where ``0`` is the top/left edge, ``1``
+#: the middle, and ``2`` the bottom/right edge.  Gravities missing from
+#: here are placed at the top-left corner.
+#:
+#: .. versionadded:: 0.7.0
+_GRAVITY_ALIGNMENT = {
+    'north_west': (0, 0), 'north': (0, 1), 'north_east': (0, 2),
+    'west': (1, 0), 'center': (1, 1), 'east': (1, 2),
+    'south_west': (2, 0), 'south': (2, 1), 'south_east': (2, 2)
+}
 
 
 #: (:class:`tuple`) The list of methods for :meth:`~BaseImage.merge_layers`
@@ -678,6 +738,7 @@ IMAGE_LAYER_METHOD = ('undefined', 'coalesce', 'compareany', 'compareclear',
                       'optimizeplus', 'optimizetrans', 'removedups',
                       'removezero', 'composite', 'merge', 'flatten', 'mosaic',
                       'trimbounds')
+_IMAGE_LAYER_METHOD_IDX = _Index(IMAGE_LAYER_METHOD)
 
 
 #: (:class:`tuple`) The list of image types
@@ -716,6 +777,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
                    'palette', 'palettealpha', 'truecolor', 'truecoloralpha',
                    'colorseparation', 'colorseparationalpha', 'optimize',
                    'palettebilevelalpha')
+_IMAGE_TYPES_IDX = _Index(IMAGE_TYPES)
 
 
 #: (:class:`tuple`) The list of interlace schemes.
@@ -732,6 +794,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
 #: .. versionadded:: 0.5.2
 INTERLACE_TYPES = ('undefined', 'no', 'line', 'plane', 'partition', 'gif',
                    'jpeg', 'png')
+_INTERLACE_TYPES_IDX = _Index(INTERLACE_TYPES)
 
 
 #: (:class:`tuple`) The list of builtin kernels.
@@ -834,6 +897,8 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
                           'edgein', 'edgeout', 'edge', 'tophat', 'bottom_hat',
                           'hit_and_miss', 'thinning', 'thicken', 'distance',
                           'voronoi')
+_KERNEL_INFO_TYPES_IDX = _Index(KERNEL_INFO_TYPES)
+_MORPHOLOGY_METHODS_IDX = _Index(MORPHOLOGY_METHODS)
 
 
 #: (:class:`tuple`) The list of montage behaviors used by
@@ -846,6 +911,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
 #:
 #: .. versionadded:: 0.6.8
 MONTAGE_MODES = ('undefined', 'frame', 'unframe', 'concatenate')
+_MONTAGE_MODES_IDX = _Index(MONTAGE_MODES)
 
 
 #: (:class:`tuple`) The list of noise types used by
@@ -863,6 +929,7 @@ MONTAGE_MODES = ('undefined', 'frame', 'unframe', 'concatenate')
 #: .. versionadded:: 0.5.3
 NOISE_TYPES = ('undefined', 'uniform', 'gaussian', 'multiplicative_gaussian',
                'impulse', 'laplacian', 'poisson', 'random')
+_NOISE_TYPES_IDX = _Index(NOISE_TYPES)
 
 
 #: (:class:`collections.abc.Set`) The set of available
@@ -917,6 +984,14 @@ OPTIONS = frozenset([
 ORIENTATION_TYPES = ('undefined', 'top_left', 'top_right', 'bottom_right',
                      'bottom_left', 'left_top', 'right_top', 'right_bottom',
                      'left_bottom')
+_ORIENTATION_TYPES_IDX = _Index(ORIENTATION_TYPES)
+
+#: (:class:`tuple`) The operation :meth:`BaseImage._auto_orient()` applies
+#: for each of :const:`ORIENTATION_TYPES`; either a method name, or a
+#: ``(method name, degree)`` pair for :meth:`~BaseImage.rotate()`.
+_AUTO_ORIENT_OPS = (None, None, 'flop', ('rotate', 180.0), 'flip',
+                    'transpose', ('rotate', 90.0), 'transverse',
+                    ('rotate', 270.0))
 
 
 #: (:class:`dict`) Map of papersize names to page sizes. Each page size
@@ -980,6 +1055,7 @@ PAPERSIZE_MAP = {
 PIXEL_INTERPOLATE_METHODS = ('undefined', 'average', 'average9', 'average16',
                              'background', 'bilinear', 'blend', 'catrom',
                              'integer', 'mesh', 'nearest', 'spline')
+_PIXEL_INTERPOLATE_METHODS_IDX = _Index(PIXEL_INTERPOLATE_METHODS)
 
 
 #: (:class:`tuple`) List of rendering intent types used for
@@ -995,6 +1071,7 @@ PIXEL_INTERPOLATE_METHODS = ('undefined', 'average', 'average9', 'average16',
 #: .. versionadded:: 0.5.4
 RENDERING_INTENT_TYPES = ('undefined', 'saturation', 'perceptual', 'absolute',
                           'relative')
+_RENDERING_INTENT_TYPES_IDX = _Index(RENDERING_INTENT_TYPES)
 
 
 #: (:class:`tuple`) List of sparse color methods used by
@@ -1036,6 +1113,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
     STATISTIC_TYPES = ('undefined', 'gradient', 'maximum', 'mean', 'median',
                        'minimum', 'mode', 'nonpeak', 'root_mean_square',
                        'standard_deviation')
+_STATISTIC_TYPES_IDX = _Index(STATISTIC_TYPES)
 
 
 #: (:class:`tuple`) The list of pixel storage types.
@@ -1052,6 +1130,38 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
 #: .. versionadded:: 0.5.0
 STORAGE_TYPES = ('undefined', 'char', 'double', 'float', 'integer',
                  'long', 'quantum', 'short')
+_STORAGE_TYPES_IDX = _Index(STORAGE_TYPES)
+_STORAGE_CHAR = _STORAGE_TYPES_IDX['char']
+_STORAGE_DOUBLE = _STORAGE_TYPES_IDX['double']
+
+#: (:class:`tuple`) The :mod:`ctypes` element type of each
+#: :const:`STORAGE_TYPES` entry, used by :meth:`BaseImage.export_pixels()`
+#: and :meth:`BaseImage.import_pixels()`.
+#:
+#: .. versionadded:: 0.7.0
+_STORAGE_CTYPES = (
+    None,                                # undefined
+    ctypes.c_ubyte,                      # char
+    ctypes.c_double,                     # double
+    ctypes.c_float,                      # float
+    ctypes.c_uint,                       # integer
+    ctypes.c_uint64,                     # long
+    library.PixelGetRedQuantum.restype,  # quantum
+    ctypes.c_ushort                      # short
+)
+
+#: (:class:`tuple`) The :mod:`ctypes` array types of one pixel, indexed by
+#: the number of channels, used by :meth:`BaseImage.__setitem__`.
+#:
+#: .. versionadded:: 0.7.0
+_PIXEL_TYPES = tuple(ctypes.c_double * n for n in range(6))
+
+#: (:class:`numbers.Integral`) The most doubles a region fill in
+#: :meth:`BaseImage.__setitem__` buffers at once.  Larger regions are
+#: filled in bands of whole rows, reusing the same buffer.
+#:
+#: .. versionadded:: 0.7.0
+_FILL_BUFFER_LIMIT = 65536
 
 
 #: (:class:`tuple`) The list of resolution unit types.
@@ -1068,6 +1178,7 @@ STORAGE_TYPES = ('undefined', 'char', 'double', 'float', 'integer',
 #:
 #:    __ http://www.imagemagick.org/api/magick-image.php#MagickSetImageUnits
 UNIT_TYPES = ('undefined', 'pixelsperinch', 'pixelspercentimeter')
+_UNIT_TYPES_IDX = _Index(UNIT_TYPES)
 
 
 #: (:class:`tuple`) The list of :attr:`~BaseImage.virtual_pixel` types.
@@ -1104,6 +1215,7 @@ if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
                             'horizontal_tile', 'vertical_tile',
                             'horizontal_tile_edge', 'vertical_tile_edge',
                             'checker_tile')
+_VIRTUAL_PIXEL_METHOD_IDX = _Index(VIRTUAL_PIXEL_METHOD)
 
 
 def manipulative(function):
@@ -1112,6 +1224,7 @@ def manipulative(function):
     def wrapped(self, *args, **kwargs):
         result = function(self, *args, **kwargs)
         self.dirty = True
+        self._touch()
         return result
     return wrapped
 
@@ -1120,12 +1233,123 @@ def trap_exception(function):
     @functools.wraps(function)
     def wrapped(self, *args, **kwargs):
         result = function(self, *args, **kwargs)
+        self._touch()
         if not bool(result):
             self.raise_exception()
         return result
     return wrapped
 
 
+def _get_primary_im6(getter, wand, buffer):
+    """Read a chromaticity point as ``(x, y)`` with ImageMagick-6, using
+    the given :mod:`ctypes` doubles as scratch space."""
+    x, y = buffer[0], buffer[1]
+    x.value = y.value = 0.0
+    return getter(wand, x, y), (x.value, y.value)
+
+
+def _get_primary_im7(getter, wand, buffer):  # pragma: no cover
+    """Read a chromaticity point as ``(x, y, z)`` with ImageMagick-7, using
+    the given :mod:`ctypes` doubles as scratch space."""
+    x, y, z = buffer
+    x.value = y.value = z.value = 0.0
+    return getter(wand, x, y, z), (x.value, y.value, z.value)
+
+
+#: (:class:`collections.abc.Callable`) Reads a chromaticity point with
+#: the signature matching the linked library, chosen once at import time.
+_get_primary = (_get_primary_im6 if MAGICK_VERSION_NUMBER < 0x700
+                else _get_primary_im7)
+
+
+class _PixelWandHolder:
+    """Owns one thread's scratch :c:type:`PixelWand`, and destroys it
+    once the thread's local storage drops the holder, i.e. when the
+    thread exits.
+
+    .. versionadded:: 0.7.0
+    """
+
+    __slots__ = 'pixel',
+
+    def __init__(self):
+        self.pixel = library.NewPixelWand()
+        allocate_ref(self.pixel, library.DestroyPixelWand)
+
+    def __del__(self):
+        # A no-op if wand.resource.shutdown() released it already.
+        deallocate_ref(self.pixel)
+
+
+#: (:class:`threading.local`) Holds one :class:`_PixelWandHolder`
+#: per thread for the color getters.
+_pixel_wand_pool = threading.local()
+
+
+def _borrow_pixel_wand():
+    """Returns the calling thread's scratch :c:type:`PixelWand`, creating
+    it on first use.  Color getters fill it and copy it out through
+    :meth:`Color.from_pixelwand() <wand.color.Color.from_pixelwand>`
+    instead of allocating and destroying a wand on every read.  It can
+    also carry a fixed color into a setter that copies it.  It must not
+    be destroyed by the borrower; it's released when the thread exits,
+    or by :func:`wand.resource.shutdown()` at exit.
+
+    .. versionadded:: 0.7.0
+    """
+    holder = getattr(_pixel_wand_pool, 'holder', None)
+    if holder is None:
+        holder = _pixel_wand_pool.holder = _PixelWandHolder()
+    return holder.pixel
+
+
+#: (:class:`dict`) Pixel structures of the color strings already parsed
+#: by :func:`_parsed_color()`.  It's cleared once it holds 256 entries.
+_PARSED_COLORS = {}
+
+
+def _parsed_color(string):
+    """Creates a new :class:`~wand.color.Color` from a color string, e.g.
+    an option value like ``'fill'`` or a fixed default like ``'gray'``.
+    Each distinct string is parsed by the library only once; later calls
+    copy the cached pixel structure instead.
+
+    .. versionadded:: 0.7.0
+    """
+    raw = _PARSED_COLORS.get(string)
+    if raw is None:
+        raw = Color(string).raw.raw
+        if len(_PARSED_COLORS) >= 256:
+            _PARSED_COLORS.clear()
+        _PARSED_COLORS[string] = raw
+    return Color(raw=ctypes.create_string_buffer(raw, len(raw)))
+
+
+def _option_color_string(name):
+    """Normalizes a color name into the value stored for a color option,
+    e.g. ``'stroke'``, the way ``Color(name).string`` does.  The name is
+    parsed through :func:`_parsed_color()`, so each distinct name is
+    parsed by the library only once.
+
+    :raises ValueError: when the color name is unrecognized
+
+    .. versionadded:: 0.7.0
+    """
+    return _parsed_color(name).string
+
+
+# Library functions polled on every pixel access or per-frame property
+# read, bound once so each call skips the attribute lookup on ``library``.
+_GetImageFromMagickWand = library.GetImageFromMagickWand
+_MagickGetImageAlphaChannel = library.MagickGetImageAlphaChannel
+_MagickGetImageColorspace = library.MagickGetImageColorspace
+_MagickGetImageCompression = library.MagickGetImageCompression
+_MagickGetImageFormat = library.MagickGetImageFormat
+_MagickGetImageHeight = library.MagickGetImageHeight
+_MagickGetImageWidth = library.MagickGetImageWidth
+_MagickImportImagePixels = library.MagickImportImagePixels
+
+
 class BaseImage(Resource):
     """The abstract base of :class:`Image` (container) and
     :class:`~wand.sequence.SingleImage`.  That means the most of
@@ -1162,6 +1386,42 @@ class BaseImage(Resource):
     #: .. versionadded:: 0.5.5
     _seed = None
 
+    #: (:class:`numbers.Integral`) Internal counter increased by every
+    #: manipulation, so cached reads can tell whether they are stale.
+    #:
+    #: .. versionadded:: 0.7.0
+    _mutation_epoch = 0
+
+    #: (:class:`tuple`) Internal placeholder for :attr:`signature`, paired
+    #: with the :meth:`_mutation_state` it was computed at.
+    #:
+    #: .. versionadded:: 0.7.0
+    _signature_cache = None
+
+    #: (:class:`tuple`) Internal :class:`Iterator` used to read single
+    #: pixels, paired with the :meth:`_mutation_state` it was created at.
+    #:
+    #: .. versionadded:: 0.7.0
+    _pixel_iterator = None
+
+    #: (:class:`tuple`) The ``(state, layout)`` pair cached by
+    #: :meth:`_pixel_layout()`.
+    #:
+    #: .. versionadded:: 0.7.0
+    _layout_cache = None
+
+    #: (:class:`tuple`) Scratch :mod:`ctypes` scalars reused by
+    #: :meth:`_read_page()`.
+    #:
+    #: .. versionadded:: 0.7.0
+    _page_buffer = None
+
+    #: (:class:`tuple`) Scratch :mod:`ctypes` doubles reused by
+    #: :meth:`_scratch_doubles()`.
+    #:
+    #: .. versionadded:: 0.7.0
+    _double_buffer = None
+
     c_is_resource = library.IsMagickWand
     c_destroy_resource = library.DestroyMagickWand
     c_get_exception = library.MagickGetException
@@ -1177,12 +1437,25 @@ class BaseImage(Resource):
         self.dirty = False
 
     def __eq__(self, other):
-        if isinstance(other, type(self)):
+        if self is other:
+            return True
+        if isinstance(other, BaseImage):
+            # Images of different sizes can't be equal; no need to hash
+            # their pixels to find that out.
+            if self.size != other.size:
+                return False
             return self.signature == other.signature
         return False
 
     def __getitem__(self, idx):
-        if (not isinstance(idx, str) and isinstance(idx, abc.Iterable)):
+        # Fast path for the most common case of reading a single pixel.
+        if type(idx) is tuple and len(idx) == 2:
+            x, y = idx
+            if type(x) is int and type(y) is int:
+                return self._pixel_at(x, y)
+        # Concrete types first; the ABC check is only a fallback.
+        if (isinstance(idx, (tuple, list)) or
+                not isinstance(idx, str) and isinstance(idx, abc.Iterable)):
             idx = tuple(idx)
             d = len(idx)
             if not (1 <= d <= 2):
@@ -1196,25 +1469,15 @@ class BaseImage(Resource):
                 elif not x_slice and y_slice:
                     x = slice(x, x + 1)
                 elif not (x_slice or y_slice):
-                    if not (isinstance(x, numbers.Integral) and
-                            isinstance(y, numbers.Integral)):
+                    # Check the concrete int type first; the ABC check is
+                    # much slower, and only needed for foreign integers.
+                    if not ((isinstance(x, int) or
+                             isinstance(x, numbers.Integral)) and
+                            (isinstance(y, int) or
+                             isinstance(y, numbers.Integral))):
                         raise TypeError('x and y must be integral, not ' +
                                         repr((x, y)))
-                    if x < 0:
-                        x += self.width
-                    if y < 0:
-                        y += self.height
-                    if x >= self.width:
-                        raise IndexError('x must be less than width')
-                    elif y >= self.height:
-                        raise IndexError('y must be less than height')
-                    elif x < 0:
-                        raise IndexError('x cannot be less than 0')
-                    elif y < 0:
-                        raise IndexError('y cannot be less than 0')
-                    with iter(self) as iterator:
-                        iterator.seek(y)
-                        return iterator.__next__(x)
+                    return self._pixel_at(x, y)
                 if not (x.step is None and y.step is None):
                     raise ValueError('slicing with step is unsupported')
                 elif (x.start is None and x.stop is None and
@@ -1228,7 +1491,7 @@ class BaseImage(Resource):
                 return cloned
             else:
                 return self[idx[0]]
-        elif isinstance(idx, numbers.Integral):
+        elif isinstance(idx, int) or isinstance(idx, numbers.Integral):
             if idx < 0:
                 idx += self.height
             elif idx >= self.height:
@@ -1244,63 +1507,140 @@ class BaseImage(Resource):
             return self[:, idx]
         raise TypeError('unsupported index type: ' + repr(idx))
 
+    def _pixel_at(self, x, y):
+        """Reads the color of a single pixel.  Negative coordinates are
+        counted from the right & bottom edges.
+
+        :param x: the column of the pixel
+        :type x: :class:`numbers.Integral`
+        :param y: the row of the pixel
+        :type y: :class:`numbers.Integral`
+        :rtype: :class:`~wand.color.Color`
+        :raises IndexError: if the pixel is outside of the image
+
+        .. note::
+
+           The pixel iterator is cached, and reused for every read until
+           the image is manipulated.
+
+        .. versionadded:: 0.7.0
+        """
+        state = self._mutation_state()
+        width, height = self._pixel_layout(state)[:2]
+        if x < 0:
+            x += width
+        if y < 0:
+            y += height
+        if x >= width:
+            raise IndexError('x must be less than width')
+        elif y >= height:
+            raise IndexError('y must be less than height')
+        elif x < 0:
+            raise IndexError('x cannot be less than 0')
+        elif y < 0:
+            raise IndexError('y cannot be less than 0')
+        # Reuse the same pixel iterator until the image is manipulated.
+        cache = self._pixel_iterator
+        if cache is not None and cache[0] == state:
+            iterator = cache[1]
+        else:
+            iterator = Iterator(image=self)
+            self._pixel_iterator = state, iterator
+        iterator.seek(y)
+        return iterator.__next__(x)
+
     def __setitem__(self, idx, color):
-        if isinstance(color, str):
-            color = Color(color)
-        assertions.assert_color(color=color)
-        if not isinstance(idx, abc.Iterable):
+        # Validate everything that doesn't need the library first, so bad
+        # arguments are rejected without any foreign calls.
+        if not (isinstance(idx, (tuple, list)) or
+                isinstance(idx, abc.Iterable)):
             raise TypeError('Expecting list of x,y coordinates, not ' +
                             repr(idx))
         idx = tuple(idx)
         if len(idx) != 2:
             msg = 'pixel index can not be {0}-dimensional'.format(len(idx))
             raise ValueError(msg)
-        colorspace = self.colorspace
-        s_index = STORAGE_TYPES.index("double")
-        width, height = self.size
         x1, y1 = idx
         x2, y2 = 1, 1
-        if not (isinstance(x1, numbers.Integral) and
-                isinstance(y1, numbers.Integral)):
+        x_slice = isinstance(x1, slice)
+        y_slice = isinstance(y1, slice)
+        if not ((x_slice or isinstance(x1, int) or
+                 isinstance(x1, numbers.Integral)) and
+                (y_slice or isinstance(y1, int) or
+                 isinstance(y1, numbers.Integral))):
             raise TypeError('Expecting x & y to be integers')
-        if x1 < 0:
-            x1 += width
-        if y1 < 0:
-            y1 += height
-        if x1 >= width:
-            raise ValueError('x must be less than image width')
-        elif y1 >= height:
-            raise ValueError('y must be less than image height')
+        if isinstance(color, str):
+            color = Color(color)
+        assertions.assert_color(color=color)
+        state = self._mutation_state()
+        width, height, colorspace, alpha = self._pixel_layout(state)
+        s_index = _STORAGE_DOUBLE
+        if not x_slice:
+            if x1 < 0:
+                x1 += width
+            if x1 >= width:
+                raise ValueError('x must be less than image width')
+        if not y_slice:
+            if y1 < 0:
+                y1 += height
+            if y1 >= height:
+                raise ValueError('y must be less than image height')
+        if x_slice or y_slice:
+            # Fill the whole region with a single import call.
+            if x_slice:
+                x1, x_stop, x_step = x1.indices(width)
+                x2 = x_stop - x1
+            if y_slice:
+                y1, y_stop, y_step = y1.indices(height)
+                y2 = y_stop - y1
+            if (x_slice and x_step != 1) or (y_slice and y_step != 1):
+                raise ValueError('slicing with step is unsupported')
+            if x2 < 1 or y2 < 1:
+                return
         if colorspace == 'gray':
             channel_map = b'I'
-            pixel = (ctypes.c_double * 1)()
-            pixel[0] = color.red
+            values = [color.red]
         elif colorspace == 'cmyk':
             channel_map = b'CMYK'
-            pixel = (ctypes.c_double * 5)()
-            pixel[0] = color.red
-            pixel[1] = color.green
-            pixel[2] = color.blue
-            pixel[3] = color.black
-            if self.alpha_channel:
+            values = [color.red, color.green, color.blue, color.black]
+            if alpha:
                 channel_map += b'A'
-                pixel[4] = color.alpha
+                values.append(color.alpha)
         else:
             channel_map = b'RGB'
-            pixel = (ctypes.c_double * 4)()
-            pixel[0] = color.red
-            pixel[1] = color.green
-            pixel[2] = color.blue
-            if self.alpha_channel:
+            values = [color.red, color.green, color.blue]
+            if alpha:
                 channel_map += b'A'
-                pixel[3] = color.alpha
-        r = library.MagickImportImagePixels(self.wand,
-                                            x1, y1, x2, y2,
-                                            channel_map,
-                                            s_index,
-                                            ctypes.byref(pixel))
+                values.append(color.alpha)
+        if x2 == y2 == 1:
+            pixel = _PIXEL_TYPES[len(values)](*values)
+            r = _MagickImportImagePixels(self.wand,
+                                         x1, y1, 1, 1,
+                                         channel_map,
+                                         s_index,
+                                         ctypes.byref(pixel))
+        else:
+            row = array.array('d', values) * x2
+            rows = min(y2, max(1, _FILL_BUFFER_LIMIT // len(row)))
+            pixels = row * rows
+            pixel = (ctypes.c_double * len(pixels)).from_buffer(pixels)
+            r = True
+            y_stop = y1 + y2
+            while r and y1 < y_stop:
+                band = min(rows, y_stop - y1)
+                r = _MagickImportImagePixels(self.wand,
+                                             x1, y1, x2, band,
+                                             channel_map,
+                                             s_index,
+                                             ctypes.byref(pixel))
+                y1 += band
+        self._touch()
         if not r:
             self.raise_exception()
+        # Writing pixels leaves the geometry untouched, so keep the layout
+        # cached under the new epoch.
+        self._layout_cache = ((self._mutation_epoch, state[1]),
+                              self._layout_cache[1])
 
     def __hash__(self):
         return hash(self.signature)
@@ -1314,20 +1654,40 @@ class BaseImage(Resource):
     def __ne__(self, other):
         return not (self == other)
 
-    def __repr__(self, extra_format=' ({self.width}x{self.height})'):
-        cls = type(self)
-        typename = '{0}.{1}'.format(
-            cls.__module__,
-            getattr(cls, '__qualname__', cls.__name__)
-        )
+    def __repr__(self, extra_format=None):
+        typename = self._repr_typename()
         if getattr(self, 'c_resource', None) is None:
-            return '<{0}: (closed)>'.format(typename)
+            return '<' + typename + ': (closed)>'
         sig = self.signature
         if not sig:
-            return '<{0}: (empty)>'.format(typename)
-        return '<{0}: {1}{2}>'.format(
-            typename, sig[:7], extra_format.format(self=self)
-        )
+            return '<' + typename + ': (empty)>'
+        if extra_format is None:
+            extra = self._repr_extra()
+        else:
+            extra = extra_format.format(self=self)
+        return '<' + typename + ': ' + sig[:7] + extra + '>'
+
+    @classmethod
+    def _repr_typename(cls):
+        """The dotted class name shown by :meth:`__repr__()`, computed
+        once per class and then cached on it.
+
+        .. versionadded:: 0.7.0
+        """
+        try:
+            return cls.__dict__['_typename']
+        except KeyError:
+            typename = cls.__module__ + '.' + getattr(cls, '__qualname__',
+                                                      cls.__name__)
+            cls._typename = typename
+            return typename
+
+    def _repr_extra(self):
+        """The details following the signature in :meth:`__repr__()`.
+
+        .. versionadded:: 0.7.0
+        """
+        return ' (%dx%d)' % (self.width, self.height)
 
     @property
     def __array_interface__(self):
@@ -1351,10 +1711,12 @@ class BaseImage(Resource):
         .. versionchanged:: 0.6.2
            Color spaces ``gray`` & ``cmyk`` are now supported.
         """
-        if not self.signature:
+        # Count the images rather than hashing every pixel with
+        # MagickGetImageSignature() just to learn the image is empty.
+        if not library.MagickGetNumberImages(self.wand):
             raise ValueError("No image data to interface with.")
         width, height = self.size
-        storage_type = 1  # CharPixel
+        storage_type = _STORAGE_CHAR
         cs = self.colorspace
         if cs in ('gray',):
             channel_format = b'R'
@@ -1432,7 +1794,7 @@ class BaseImage(Resource):
            Setting the alpha channel will apply the change to all frames
            in the image stack.
         """
-        return bool(library.MagickGetImageAlphaChannel(self.wand))
+        return _MagickGetImageAlphaChannel(self.wand)
 
     @alpha_channel.setter
     @manipulative
@@ -1444,10 +1806,10 @@ class BaseImage(Resource):
         # Map common aliases for ``'activate'``
         elif alpha_type is True or (alpha_type == 'on' and is_im6):
             alpha_type = 'activate'
-        assertions.string_in_list(ALPHA_CHANNEL_TYPES,
+        assertions.string_in_list(_ALPHA_CHANNEL_TYPES_IDX,
                                   'wand.image.ALPHA_CHANNEL_TYPES',
                                   alpha_channel=alpha_type)
-        alpha_index = ALPHA_CHANNEL_TYPES.index(alpha_type)
+        alpha_index = _ALPHA_CHANNEL_TYPES_IDX[alpha_type]
         library.MagickSetLastIterator(self.wand)
         n = library.MagickGetIteratorIndex(self.wand)
         library.MagickResetIterator(self.wand)
@@ -1484,7 +1846,7 @@ class BaseImage(Resource):
         .. versionchanged:: 0.5.0
            Previously named :attr:`font_antialias`.
         """
-        return bool(library.MagickGetAntialias(self.wand))
+        return library.MagickGetAntialias(self.wand)
 
     @antialias.setter
     @manipulative
@@ -1502,18 +1864,17 @@ class BaseImage(Resource):
         .. versionchanged:: 0.6.7
            Allow property to be set before image read.
         """
-        pixel = library.NewPixelWand()
         if library.MagickGetNumberImages(self.wand):
+            pixel = _borrow_pixel_wand()
             result = library.MagickGetImageBackgroundColor(self.wand, pixel)
+            if not result:  # pragma: no cover
+                self.raise_exception()
+            color = Color.from_pixelwand(pixel)
         else:
             pixel = library.MagickGetBackgroundColor(self.wand)
-            result = True
-        if not result:  # pragma: no cover
-            self.raise_exception()
-        else:
             color = Color.from_pixelwand(pixel)
             pixel = library.DestroyPixelWand(pixel)
-            return color
+        return color
 
     @background_color.setter
     @manipulative
@@ -1542,17 +1903,8 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.5.2
         """
-        x = ctypes.c_double(0.0)
-        y = ctypes.c_double(0.0)
-        r = None
-        p = None
-        if MAGICK_VERSION_NUMBER < 0x700:
-            r = library.MagickGetImageBluePrimary(self.wand, x, y)
-            p = (x.value, y.value)
-        else:  # pragma: no cover
-            z = ctypes.c_double(0.0)
-            r = library.MagickGetImageBluePrimary(self.wand, x, y, z)
-            p = (x.value, y.value, z.value)
+        r, p = _get_primary(library.MagickGetImageBluePrimary, self.wand,
+                            self._scratch_doubles())
         if not r:  # pragma: no cover
             self.raise_exception()
         return p
@@ -1560,7 +1912,8 @@ class BaseImage(Resource):
     @blue_primary.setter
     def blue_primary(self, coordinates):
         r = None
-        if not isinstance(coordinates, abc.Sequence):
+        if not (isinstance(coordinates, (tuple, list)) or
+                isinstance(coordinates, abc.Sequence)):
             raise TypeError('Primary must be a tuple')
         if MAGICK_VERSION_NUMBER < 0x700:
             x, y = coordinates
@@ -1578,14 +1931,11 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.5.4
         """
-        pixel = library.NewPixelWand()
+        pixel = _borrow_pixel_wand()
         result = library.MagickGetImageBorderColor(self.wand, pixel)
         if not result:  # pragma: no cover
             self.raise_exception()
-        else:
-            color = Color.from_pixelwand(pixel)
-            pixel = library.DestroyPixelWand(pixel)
-            return color
+        return Color.from_pixelwand(pixel)
 
     @border_color.setter
     def border_color(self, color):
@@ -1617,7 +1967,7 @@ class BaseImage(Resource):
         .. versionadded:: 0.3.4
 
         """
-        colorspace_type_index = library.MagickGetImageColorspace(self.wand)
+        colorspace_type_index = _MagickGetImageColorspace(self.wand)
         if not colorspace_type_index:  # pragma: no cover
             self.raise_exception()
         return COLORSPACE_TYPES[colorspace_type_index]
@@ -1625,12 +1975,12 @@ class BaseImage(Resource):
     @colorspace.setter
     @manipulative
     def colorspace(self, colorspace_type):
-        assertions.string_in_list(COLORSPACE_TYPES,
+        assertions.string_in_list(_COLORSPACE_TYPES_IDX,
                                   'wand.image.COLORSPACE_TYPES',
                                   colorspace=colorspace_type)
         r = library.MagickSetImageColorspace(
             self.wand,
-            COLORSPACE_TYPES.index(colorspace_type)
+            _COLORSPACE_TYPES_IDX[colorspace_type]
         )
         if not r:  # pragma: no cover
             self.raise_exception()
@@ -1648,11 +1998,11 @@ class BaseImage(Resource):
 
     @compose.setter
     def compose(self, operator):
-        assertions.string_in_list(COMPOSITE_OPERATORS,
+        assertions.string_in_list(_COMPOSITE_OPERATORS_IDX,
                                   'wand.image.COMPOSITE_OPERATORS',
                                   compose=operator)
         library.MagickSetImageCompose(self.wand,
-                                      COMPOSITE_OPERATORS.index(operator))
+                                      _COMPOSITE_OPERATORS_IDX[operator])
 
     @property
     def compression(self):
@@ -1665,22 +2015,17 @@ class BaseImage(Resource):
            Setting :attr:`compression` now sets both `image_info`
            and `images` in the internal image stack.
         """
-        compression_index = library.MagickGetImageCompression(self.wand)
+        compression_index = _MagickGetImageCompression(self.wand)
         return COMPRESSION_TYPES[compression_index]
 
     @compression.setter
     def compression(self, value):
-        assertions.string_in_list(COMPRESSION_TYPES,
+        assertions.string_in_list(_COMPRESSION_TYPES_IDX,
                                   'wand.image.COMPRESSION_TYPES',
                                   compression=value)
-        library.MagickSetCompression(
-            self.wand,
-            COMPRESSION_TYPES.index(value)
-        )
-        library.MagickSetImageCompression(
-            self.wand,
-            COMPRESSION_TYPES.index(value)
-        )
+        compression_idx = _COMPRESSION_TYPES_IDX[value]
+        library.MagickSetCompression(self.wand, compression_idx)
+        library.MagickSetImageCompression(self.wand, compression_idx)
 
     @property
     def compression_quality(self):
@@ -1760,23 +2105,27 @@ class BaseImage(Resource):
 
     @dispose.setter
     def dispose(self, value):
-        assertions.string_in_list(DISPOSE_TYPES,
+        assertions.string_in_list(_DISPOSE_TYPES_IDX,
                                   'wand.image.DISPOSE_TYPES',
                                   dispose=value)
-        library.MagickSetImageDispose(self.wand, DISPOSE_TYPES.index(value))
+        library.MagickSetImageDispose(self.wand, _DISPOSE_TYPES_IDX[value])
 
     @property
     def font(self):
         """(:class:`wand.font.Font`) The current font options."""
-        if not self.font_path:
+        path = self.font_path
+        if not path:
             return None
+        options = self.options
+        stroke = options['stroke']
+        stroke_width = options['strokewidth']
         return Font(
-            path=self.font_path,
-            size=self.font_size,
-            color=self.font_color,
-            antialias=self.antialias,
-            stroke_color=self.stroke_color,
-            stroke_width=self.stroke_width
+            path=path,
+            size=library.MagickGetPointsize(self.wand),
+            color=_parsed_color(options['fill']),
+            antialias=library.MagickGetAntialias(self.wand),
+            stroke_color=_parsed_color(stroke) if stroke else None,
+            stroke_width=float(stroke_width) if stroke_width else None
         )
 
     @font.setter
@@ -1807,15 +2156,17 @@ class BaseImage(Resource):
 
     @property
     def font_color(self):
-        return Color(self.options['fill'])
+        return _parsed_color(self.options['fill'])
 
     @font_color.setter
     @manipulative
     def font_color(self, color):
         if isinstance(color, str):
-            color = Color(color)
-        assertions.assert_color(font_color=color)
-        self.options['fill'] = color.string
+            string = _option_color_string(color)
+        else:
+            assertions.assert_color(font_color=color)
+            string = color.string
+        self.options['fill'] = string
 
     @property
     def font_path(self):
@@ -1877,7 +2228,7 @@ class BaseImage(Resource):
 
         """
         fmt_str = None
-        fmt_p = library.MagickGetImageFormat(self.wand)
+        fmt_p = _MagickGetImageFormat(self.wand)
         if fmt_p:
             fmt_str = text(ctypes.string_at(fmt_p))
             fmt_p = library.MagickRelinquishMemory(fmt_p)
@@ -1925,10 +2276,10 @@ class BaseImage(Resource):
     @gravity.setter
     @manipulative
     def gravity(self, value):
-        assertions.string_in_list(GRAVITY_TYPES,
+        assertions.string_in_list(_GRAVITY_TYPES_IDX,
                                   'wand.image.GRAVITY_TYPES',
                                   gravity=value)
-        library.MagickSetGravity(self.wand, GRAVITY_TYPES.index(value))
+        library.MagickSetGravity(self.wand, _GRAVITY_TYPES_IDX[value])
 
     @property
     def green_primary(self):
@@ -1938,17 +2289,8 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.5.2
         """
-        x = ctypes.c_double(0.0)
-        y = ctypes.c_double(0.0)
-        r = None
-        p = None
-        if MAGICK_VERSION_NUMBER < 0x700:
-            r = library.MagickGetImageGreenPrimary(self.wand, x, y)
-            p = (x.value, y.value)
-        else:  # pragma: no cover
-            z = ctypes.c_double(0.0)
-            r = library.MagickGetImageGreenPrimary(self.wand, x, y, z)
-            p = (x.value, y.value, z.value)
+        r, p = _get_primary(library.MagickGetImageGreenPrimary, self.wand,
+                            self._scratch_doubles())
         if not r:  # pragma: no cover
             self.raise_exception()
         return p
@@ -1956,7 +2298,8 @@ class BaseImage(Resource):
     @green_primary.setter
     def green_primary(self, coordinates):
         r = None
-        if not isinstance(coordinates, abc.Sequence):
+        if not (isinstance(coordinates, (tuple, list)) or
+                isinstance(coordinates, abc.Sequence)):
             raise TypeError('Primary must be a tuple')
         if MAGICK_VERSION_NUMBER < 0x700:
             x, y = coordinates
@@ -1970,7 +2313,7 @@ class BaseImage(Resource):
     @property
     def height(self):
         """(:class:`numbers.Integral`) The height of this image."""
-        return library.MagickGetImageHeight(self.wand)
+        return _MagickGetImageHeight(self.wand)
 
     @height.setter
     @manipulative
@@ -2015,10 +2358,10 @@ class BaseImage(Resource):
 
     @interlace_scheme.setter
     def interlace_scheme(self, scheme):
-        assertions.string_in_list(INTERLACE_TYPES,
+        assertions.string_in_list(_INTERLACE_TYPES_IDX,
                                   'wand.image.INTERLACE_TYPES',
                                   interlace_scheme=scheme)
-        scheme_idx = INTERLACE_TYPES.index(scheme)
+        scheme_idx = _INTERLACE_TYPES_IDX[scheme]
         library.MagickSetImageInterlaceScheme(self.wand, scheme_idx)
 
     @property
@@ -2033,10 +2376,10 @@ class BaseImage(Resource):
 
     @interpolate_method.setter
     def interpolate_method(self, method):
-        assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+        assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                   'wand.image.PIXEL_INTERPOLATE_METHODS',
                                   interpolate_method=method)
-        method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+        method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
         library.MagickSetImageInterpolateMethod(self.wand, method_idx)
 
     @property
@@ -2083,14 +2426,11 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.4.1
         """
-        pixel = library.NewPixelWand()
+        pixel = _borrow_pixel_wand()
         result = library.MagickGetImageMatteColor(self.wand, pixel)
-        if result:
-            color = Color.from_pixelwand(pixel)
-            pixel = library.DestroyPixelWand(pixel)
-            return color
-        else:  # pragma: no cover
+        if not result:  # pragma: no cover
             self.raise_exception()
+        return Color.from_pixelwand(pixel)
 
     @matte_color.setter
     @manipulative
@@ -2166,10 +2506,10 @@ class BaseImage(Resource):
     @orientation.setter
     @manipulative
     def orientation(self, value):
-        assertions.string_in_list(ORIENTATION_TYPES,
+        assertions.string_in_list(_ORIENTATION_TYPES_IDX,
                                   'wand.image.ORIENTATION_TYPES',
                                   orientation=value)
-        index = ORIENTATION_TYPES.index(value)
+        index = _ORIENTATION_TYPES_IDX[value]
         library.MagickSetImageOrientation(self.wand, index)
 
     @property
@@ -2197,13 +2537,7 @@ class BaseImage(Resource):
         .. versionchanged:: 0.6.4
            Added support for setting by papersize.
         """
-        w = ctypes.c_size_t()
-        h = ctypes.c_size_t()
-        x = ctypes.c_ssize_t()
-        y = ctypes.c_ssize_t()
-        r = library.MagickGetImagePage(self.wand, w, h, x, y)
-        if not r:  # pragma: no cover
-            self.raise_exception()
+        w, h, x, y = self._read_page()
         return int(w.value), int(h.value), int(x.value), int(y.value)
 
     @page.setter
@@ -2217,7 +2551,8 @@ class BaseImage(Resource):
             newpage = (ri.width, ri.height, ri.x, ri.y)
             libmagick.DestroyString(c_ptr)
             del ri
-        if isinstance(newpage, abc.Sequence):
+        if (isinstance(newpage, (tuple, list)) or
+                isinstance(newpage, abc.Sequence)):
             w, h, x, y = newpage
         else:
             raise TypeError("page layout must be 4-tuple")
@@ -2225,6 +2560,57 @@ class BaseImage(Resource):
         if not r:  # pragma: no cover
             self.raise_exception()
 
+    def _read_page(self):
+        """Reads the page geometry into a scratch ``(width, height, x, y)``
+        tuple of :mod:`ctypes` scalars, allocated once per image.
+
+        :rtype: :class:`tuple`
+
+        .. versionadded:: 0.7.0
+        """
+        buf = self._page_buffer
+        if buf is None:
+            buf = (ctypes.c_size_t(), ctypes.c_size_t(),
+                   ctypes.c_ssize_t(), ctypes.c_ssize_t())
+            self._page_buffer = buf
+        r = library.MagickGetImagePage(self.wand, *buf)
+        if not r:  # pragma: no cover
+            self.raise_exception()
+        return buf
+
+    def _scratch_doubles(self):
+        """Three :class:`ctypes.c_double` scalars, allocated once per image,
+        for getters that read coordinates through output parameters.
+
+        :rtype: :class:`tuple`
+
+        .. versionadded:: 0.7.0
+        """
+        buf = self._double_buffer
+        if buf is None:
+            buf = (ctypes.c_double(), ctypes.c_double(), ctypes.c_double())
+            self._double_buffer = buf
+        return buf
+
+    @manipulative
+    def _set_page_field(self, index, value):
+        """Replaces a single field of the page geometry, without building
+        the whole :attr:`page` tuple to change one of its values.
+
+        :param index: the field to change, in ``(width, height, x, y)``
+                      order
+        :type index: :class:`numbers.Integral`
+        :param value: the new value of the field
+        :type value: :class:`numbers.Integral`
+
+        .. versionadded:: 0.7.0
+        """
+        page = self._read_page()
+        page[index].value = value
+        r = library.MagickSetImagePage(self.wand, *page)
+        if not r:  # pragma: no cover
+            self.raise_exception()
+
     @property
     def page_height(self):
         """(:class:`numbers.Integral`) The height of the page for this wand.
@@ -2235,11 +2621,8 @@ class BaseImage(Resource):
         return self.page[1]
 
     @page_height.setter
-    @manipulative
     def page_height(self, height):
-        newpage = list(self.page)
-        newpage[1] = height
-        self.page = newpage
+        self._set_page_field(1, height)
 
     @property
     def page_width(self):
@@ -2251,11 +2634,8 @@ class BaseImage(Resource):
         return self.page[0]
 
     @page_width.setter
-    @manipulative
     def page_width(self, width):
-        newpage = list(self.page)
-        newpage[0] = width
-        self.page = newpage
+        self._set_page_field(0, width)
 
     @property
     def page_x(self):
@@ -2267,11 +2647,8 @@ class BaseImage(Resource):
         return self.page[2]
 
     @page_x.setter
-    @manipulative
     def page_x(self, x):
-        newpage = list(self.page)
-        newpage[2] = x
-        self.page = newpage
+        self._set_page_field(2, x)
 
     @property
     def page_y(self):
@@ -2283,11 +2660,8 @@ class BaseImage(Resource):
         return self.page[3]
 
     @page_y.setter
-    @manipulative
     def page_y(self, y):
-        newpage = list(self.page)
-        newpage[3] = y
-        self.page = newpage
+        self._set_page_field(3, y)
 
     @property
     def quantum_range(self):
@@ -2296,10 +2670,12 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.2.0
 
+        .. versionchanged:: 0.7.0
+           Returns the :const:`~wand.version.QUANTUM_RANGE` constant read
+           once at import, instead of querying the library on every access.
+
         """
-        result = ctypes.c_size_t()
-        library.MagickGetQuantumRange(ctypes.byref(result))
-        return result.value
+        return QUANTUM_RANGE
 
     @property
     def red_primary(self):
@@ -2309,17 +2685,8 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.5.2
         """
-        x = ctypes.c_double(0.0)
-        y = ctypes.c_double(0.0)
-        r = None
-        p = None
-        if MAGICK_VERSION_NUMBER < 0x700:
-            r = library.MagickGetImageRedPrimary(self.wand, x, y)
-            p = (x.value, y.value)
-        else:  # pragma: no cover
-            z = ctypes.c_double(0.0)
-            r = library.MagickGetImageRedPrimary(self.wand, x, y, z)
-            p = (x.value, y.value, z.value)
+        r, p = _get_primary(library.MagickGetImageRedPrimary, self.wand,
+                            self._scratch_doubles())
         if not r:  # pragma: no cover
             self.raise_exception()
         return p
@@ -2327,7 +2694,8 @@ class BaseImage(Resource):
     @red_primary.setter
     def red_primary(self, coordinates):
         r = None
-        if not isinstance(coordinates, abc.Sequence):
+        if not (isinstance(coordinates, (tuple, list)) or
+                isinstance(coordinates, abc.Sequence)):
             raise TypeError('Primary must be a tuple')
         if MAGICK_VERSION_NUMBER < 0x700:
             x, y = coordinates
@@ -2350,10 +2718,10 @@ class BaseImage(Resource):
 
     @rendering_intent.setter
     def rendering_intent(self, value):
-        assertions.string_in_list(RENDERING_INTENT_TYPES,
+        assertions.string_in_list(_RENDERING_INTENT_TYPES_IDX,
                                   'wand.image.RENDERING_INTENT_TYPES',
                                   rendering_intent=value)
-        ri_index = RENDERING_INTENT_TYPES.index(value)
+        ri_index = _RENDERING_INTENT_TYPES_IDX[value]
         library.MagickSetImageRenderingIntent(self.wand, ri_index)
 
     @property
@@ -2366,8 +2734,8 @@ class BaseImage(Resource):
            Resolution returns a tuple of float values to
            match ImageMagick's behavior.
         """
-        x = ctypes.c_double(0.0)
-        y = ctypes.c_double(0.0)
+        x, y, _ = self._scratch_doubles()
+        x.value = y.value = 0.0
         r = library.MagickGetImageResolution(self.wand, x, y)
         if not r:  # pragma: no cover
             self.raise_exception()
@@ -2376,7 +2744,8 @@ class BaseImage(Resource):
     @resolution.setter
     @manipulative
     def resolution(self, geometry):
-        if isinstance(geometry, abc.Sequence):
+        if (isinstance(geometry, (tuple, list)) or
+                isinstance(geometry, abc.Sequence)):
             x, y = geometry
         elif isinstance(geometry, numbers.Real):
             x, y = geometry, geometry
@@ -2474,12 +2843,21 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.1.9
 
+        .. versionchanged:: 0.7.0
+           The digest is cached until the image is manipulated.
+
         """
+        state = self._mutation_state()
+        cache = self._signature_cache
+        if cache is not None and cache[0] == state:
+            return cache[1]
         sig_str = None
         sig_p = library.MagickGetImageSignature(self.wand)
         if sig_p:
-            sig_str = text(ctypes.string_at(sig_p))
+            # A hex digest is always plain ASCII.
+            sig_str = ctypes.string_at(sig_p).decode('ascii')
             sig_p = library.MagickRelinquishMemory(sig_p)
+        self._signature_cache = state, sig_str
         return sig_str
 
     @property
@@ -2528,13 +2906,13 @@ class BaseImage(Resource):
     @property
     def stroke_color(self):
         stroke = self.options['stroke']
-        return Color(stroke) if stroke else None
+        return _parsed_color(stroke) if stroke else None
 
     @stroke_color.setter
     def stroke_color(self, color):
         if isinstance(color, str):
-            color = Color(color)
-        if isinstance(color, Color):
+            self.options['stroke'] = _option_color_string(color)
+        elif isinstance(color, Color):
             self.options['stroke'] = color.string
         elif color is None:
             del self.options['stroke']
@@ -2585,10 +2963,10 @@ class BaseImage(Resource):
     @type.setter
     @manipulative
     def type(self, image_type):
-        assertions.string_in_list(IMAGE_TYPES, 'wand.image.IMAGE_TYPES',
+        assertions.string_in_list(_IMAGE_TYPES_IDX, 'wand.image.IMAGE_TYPES',
                                   type=image_type)
         r = library.MagickSetImageType(self.wand,
-                                       IMAGE_TYPES.index(image_type))
+                                       _IMAGE_TYPES_IDX[image_type])
         if not r:  # pragma: no cover
             self.raise_exception()
 
@@ -2601,9 +2979,9 @@ class BaseImage(Resource):
     @units.setter
     @manipulative
     def units(self, units):
-        assertions.string_in_list(UNIT_TYPES, 'wand.image.UNIT_TYPES',
+        assertions.string_in_list(_UNIT_TYPES_IDX, 'wand.image.UNIT_TYPES',
                                   units=units)
-        r = library.MagickSetImageUnits(self.wand, UNIT_TYPES.index(units))
+        r = library.MagickSetImageUnits(self.wand, _UNIT_TYPES_IDX[units])
         if not r:  # pragma: no cover
             self.raise_exception()
 
@@ -2618,12 +2996,12 @@ class BaseImage(Resource):
 
     @virtual_pixel.setter
     def virtual_pixel(self, method):
-        assertions.string_in_list(VIRTUAL_PIXEL_METHOD,
+        assertions.string_in_list(_VIRTUAL_PIXEL_METHOD_IDX,
                                   'wand.image.VIRTUAL_PIXEL_METHOD',
                                   virtual_pixel=method)
         library.MagickSetImageVirtualPixelMethod(
             self.wand,
-            VIRTUAL_PIXEL_METHOD.index(method)
+            _VIRTUAL_PIXEL_METHOD_IDX[method]
         )
 
     @property
@@ -2643,6 +3021,7 @@ class BaseImage(Resource):
             self.resource = wand
         except TypeError:
             raise TypeError(repr(wand) + ' is not a MagickWand instance')
+        self._touch()
 
     @wand.deleter
     def wand(self):
@@ -2651,7 +3030,7 @@ class BaseImage(Resource):
     @property
     def width(self):
         """(:class:`numbers.Integral`) The width of this image."""
-        return library.MagickGetImageWidth(self.wand)
+        return _MagickGetImageWidth(self.wand)
 
     @width.setter
     @manipulative
@@ -2667,17 +3046,8 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.5.2
         """
-        x = ctypes.c_double(0.0)
-        y = ctypes.c_double(0.0)
-        r = None
-        p = None
-        if MAGICK_VERSION_NUMBER < 0x700:
-            r = library.MagickGetImageWhitePoint(self.wand, x, y)
-            p = (x.value, y.value)
-        else:  # pragma: no cover
-            z = ctypes.c_double(0.0)
-            r = library.MagickGetImageWhitePoint(self.wand, x, y, z)
-            p = (x.value, y.value, z.value)
+        r, p = _get_primary(library.MagickGetImageWhitePoint, self.wand,
+                            self._scratch_doubles())
         if not r:  # pragma: no cover
             self.raise_exception()
         return p
@@ -2685,7 +3055,8 @@ class BaseImage(Resource):
     @white_point.setter
     def white_point(self, coordinates):
         r = None
-        if not isinstance(coordinates, abc.Sequence):
+        if not (isinstance(coordinates, (tuple, list)) or
+                isinstance(coordinates, abc.Sequence)):
             raise TypeError('Primary must be a tuple')
         if MAGICK_VERSION_NUMBER < 0x700:
             x, y = coordinates
@@ -2716,28 +3087,58 @@ class BaseImage(Resource):
         if not exif_orientation:
             return
 
-        orientation_type = ORIENTATION_TYPES[int(exif_orientation)]
-
-        fn_lookup = {
-            'undefined': None,
-            'top_left': None,
-            'top_right': self.flop,
-            'bottom_right': functools.partial(self.rotate, degree=180.0),
-            'bottom_left': self.flip,
-            'left_top': self.transpose,
-            'right_top': functools.partial(self.rotate, degree=90.0),
-            'right_bottom': self.transverse,
-            'left_bottom': functools.partial(self.rotate, degree=270.0)
-        }
-
-        fn = fn_lookup.get(orientation_type)
+        op = _AUTO_ORIENT_OPS[int(exif_orientation)]
 
-        if not fn:
+        if op is None:
             return
-
-        fn()
+        elif isinstance(op, tuple):
+            getattr(self, op[0])(degree=op[1])
+        else:
+            getattr(self, op)()
         self.orientation = 'top_left'
 
+    def _touch(self):
+        """Marks the image as changed, so cached reads are taken again:
+        bumps the :meth:`_mutation_state` and drops the cached pixel
+        iterator, which may point at pixels that were replaced.
+
+        .. versionadded:: 0.7.0
+        """
+        self._mutation_epoch += 1
+        self._pixel_iterator = None
+
+    def _mutation_state(self):
+        """Identifies the current state of the image, so cached reads can
+        tell whether they are stale.  It changes whenever the image is
+        manipulated, or the current image of the sequence changes.
+
+        :rtype: :class:`tuple`
+
+        .. versionadded:: 0.7.0
+        """
+        return (self._mutation_epoch,
+                _GetImageFromMagickWand(self.wand))
+
+    def _pixel_layout(self, state=None):
+        """The ``(width, height, colorspace, alpha_channel)`` of the current
+        image, read from the library only once per :meth:`_mutation_state()`
+        so per-pixel access doesn't pay for four calls every time.
+
+        :param state: the already known :meth:`_mutation_state()`
+        :type state: :class:`tuple`
+        :rtype: :class:`tuple`
+
+        .. versionadded:: 0.7.0
+        """
+        if state is None:
+            state = self._mutation_state()
+        cache = self._layout_cache
+        if cache is not None and cache[0] == state:
+            return cache[1]
+        layout = (self.width, self.height, self.colorspace, self.alpha_channel)
+        self._layout_cache = state, layout
+        return layout
+
     def _channel_to_mask(self, value):
         """Attempts to resolve user input into a :c:type:`ChannelType`
         bit-mask. User input can be an integer, a string defined in
@@ -2765,10 +3166,15 @@ class BaseImage(Resource):
         if isinstance(value, numbers.Integral) and not isinstance(value, bool):
             mask = value
         elif isinstance(value, str):
-            if value in CHANNELS:
-                mask = CHANNELS[value]
-            elif libmagick.ParseChannelOption:
+            mask = CHANNELS.get(value, -1)
+            if mask < 0:
+                mask = _PARSED_CHANNEL_MASKS.get(value, -1)
+            if mask < 0 and libmagick.ParseChannelOption:
                 mask = libmagick.ParseChannelOption(binary(value))
+                if mask >= 0:
+                    if len(_PARSED_CHANNEL_MASKS) >= 256:
+                        _PARSED_CHANNEL_MASKS.clear()
+                    _PARSED_CHANNEL_MASKS[value] = mask
         else:
             raise TypeError(repr(value) + ' is an invalid channel type'
                             '; see wand.image.CHANNELS dictionary')
@@ -2792,22 +3198,23 @@ class BaseImage(Resource):
         .. versionadded:: 0.5.3
         """
         top, left = 0, 0
-        assertions.string_in_list(GRAVITY_TYPES, 'wand.image.GRAVITY_TYPES',
+        assertions.string_in_list(_GRAVITY_TYPES_IDX,
+                                  'wand.image.GRAVITY_TYPES',
                                   gravity=gravity)
+        row, column = _GRAVITY_ALIGNMENT.get(gravity, (0, 0))
+        if not (row or column):
+            return top, left
+        image_width, image_height = self.size
         # Set `top` based on given gravity
-        if gravity in ('north_west', 'north', 'north_east'):
-            top = 0
-        elif gravity in ('west', 'center', 'east'):
-            top = int(self.height / 2) - int(height / 2)
-        elif gravity in ('south_west', 'south', 'south_east'):
-            top = self.height - height
+        if row == 1:
+            top = int(image_height / 2) - int(height / 2)
+        elif row == 2:
+            top = image_height - height
         # Set `left` based on given gravity
-        if gravity in ('north_west', 'west', 'south_west'):
-            left = 0
-        elif gravity in ('north', 'center', 'south'):
-            left = int(self.width / 2) - int(width / 2)
-        elif gravity in ('north_east', 'east', 'south_east'):
-            left = self.width - width
+        if column == 1:
+            left = int(image_width / 2) - int(width / 2)
+        elif column == 2:
+            left = image_width - width
         return top, left
 
     @manipulative
@@ -3084,10 +3491,10 @@ class BaseImage(Resource):
         if library.MagickAutoThresholdImage is None:
             msg = 'Method requires ImageMagick version 7.0.8-41 or greater.'
             raise WandLibraryVersionError(msg)
-        assertions.string_in_list(AUTO_THRESHOLD_METHODS,
+        assertions.string_in_list(_AUTO_THRESHOLD_METHODS_IDX,
                                   'wand.image.AUTO_THRESHOLD_METHODS',
                                   method=method)
-        method_idx = AUTO_THRESHOLD_METHODS.index(method)
+        method_idx = _AUTO_THRESHOLD_METHODS_IDX[method]
         return library.MagickAutoThresholdImage(self.wand, method_idx)
 
     @manipulative
@@ -3237,10 +3644,10 @@ class BaseImage(Resource):
                 result = library.MagickBorderImage(self.wand, color.resource,
                                                    width, height)
             else:  # pragma: no cover
-                assertions.string_in_list(COMPOSITE_OPERATORS,
+                assertions.string_in_list(_COMPOSITE_OPERATORS_IDX,
                                           'wand.image.COMPOSITE_OPERATORS',
                                           compose=compose)
-                compose_idx = COMPOSITE_OPERATORS.index(compose)
+                compose_idx = _COMPOSITE_OPERATORS_IDX[compose]
                 result = library.MagickBorderImage(self.wand, color.resource,
                                                    width, height, compose_idx)
         return result
@@ -3353,7 +3760,7 @@ class BaseImage(Resource):
         if font is not None and not isinstance(font, Font):
             raise TypeError('font must be a wand.font.Font, not ' + repr(font))
         if gravity is not None:
-            assertions.string_in_list(GRAVITY_TYPES,
+            assertions.string_in_list(_GRAVITY_TYPES_IDX,
                                       'wand.image.GRAVITY_TYPES',
                                       gravity=gravity)
         if width is None:
@@ -3375,11 +3782,13 @@ class BaseImage(Resource):
             library.MagickSetSize(textboard.wand, width, height)
             textboard.font = font
             textboard.gravity = gravity or self.gravity
-            with Color('transparent') as background_color:
-                library.MagickSetBackgroundColor(textboard.wand,
-                                                 background_color.resource)
+            # Set the color on the scratch pixel wand directly, rather than
+            # parsing, allocating & destroying a Color for every caption.
+            background_color = _borrow_pixel_wand()
+            library.PixelSetColor(background_color, b'transparent')
+            library.MagickSetBackgroundColor(textboard.wand, background_color)
             textboard.read(filename=b'caption:' + text.encode('utf-8'))
-            self.composite(textboard, left, top)
+            self._composite_fast(textboard.wand, int(left), int(top))
 
     def cdl(self, ccc):
         """Alias for :meth:`color_decision_list`.
@@ -3550,10 +3959,10 @@ class BaseImage(Resource):
                                                    channel_ch,
                                                    image.wand)
         else:  # pragma: no cover
-            assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+            assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                       'wand.image.PIXEL_INTERPOLATE_METHODS',
                                       pixel_interpolate_method=method)
-            method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+            method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
             if channel is None:
                 r = library.MagickClutImage(self.wand, image.wand, method_idx)
             else:
@@ -3645,24 +4054,36 @@ class BaseImage(Resource):
             if not isinstance(color, Color):
                 raise TypeError('expecting in instance of Color, not ' +
                                 repr(color))
-            with color:
-                r = library.MagickSetImageColormapColor(self.wand,
-                                                        index,
-                                                        color.resource)
-                if not r:  # pragma: no cover
-                    self.raise_exception()
+            self._set_color_map(index, color)
         else:
-            color_ptr = library.NewPixelWand()
+            color_ptr = _borrow_pixel_wand()
             r = library.MagickGetImageColormapColor(self.wand,
                                                     index,
                                                     color_ptr)
             if not r:  # pragma: no cover
-                color_ptr = library.DestroyPixelWand(color_ptr)
                 self.raise_exception()
             color = Color.from_pixelwand(color_ptr)
-            color_ptr = library.DestroyPixelWand(color_ptr)
         return color
 
+    @manipulative
+    def _set_color_map(self, index, color):
+        """Replaces the palette entry at ``index``, which also recolors
+        every pixel using it.
+
+        :param index: The color position of the image palette.
+        :type index: :class:`numbers.Integral`
+        :param color: The new color.
+        :type color: :class:`wand.color.Color`
+
+        .. versionadded:: 0.7.0
+        """
+        with color:
+            r = library.MagickSetImageColormapColor(self.wand,
+                                                    index,
+                                                    color.resource)
+            if not r:  # pragma: no cover
+                self.raise_exception()
+
     @manipulative
     @trap_exception
     def color_matrix(self, matrix):
@@ -3857,11 +4278,11 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.5.9
         """
-        assertions.string_in_list(COLORSPACE_TYPES,
+        assertions.string_in_list(_COLORSPACE_TYPES_IDX,
                                   'wand.image.COLORSPACE_TYPES',
                                   colorspace=colorspace)
         library.MagickResetIterator(self.wand)
-        colorspace_c = COLORSPACE_TYPES.index(colorspace)
+        colorspace_c = _COLORSPACE_TYPES_IDX[colorspace]
         channel_c = self._channel_to_mask(channel)
         if MAGICK_VERSION_NUMBER < 0x700:
             new_wand = library.MagickCombineImages(self.wand, channel_c)
@@ -3917,7 +4338,7 @@ class BaseImage(Resource):
         .. versionchanged:: 0.5.3
            Added support for ``highlight`` & ``lowlight``.
         """
-        assertions.string_in_list(COMPARE_METRICS,
+        assertions.string_in_list(_COMPARE_METRICS_IDX,
                                   'wand.image.COMPARE_METRICS',
                                   metric=metric)
         if highlight:
@@ -3932,7 +4353,7 @@ class BaseImage(Resource):
             library.MagickSetImageArtifact(self.wand,
                                            b'compare:lowlight-color',
                                            binary(lowlight))
-        metric = COMPARE_METRICS.index(metric)
+        metric = _COMPARE_METRICS_IDX[metric]
         distortion = ctypes.c_double(0.0)
         compared_image = library.MagickCompareImages(self.wand, image.wand,
                                                      metric,
@@ -3979,14 +4400,14 @@ class BaseImage(Resource):
         if library.MagickComplexImages is None:
             msg = 'Method requires ImageMagick version 7.0.8-41 or greater.'
             raise WandLibraryVersionError(msg)
-        assertions.string_in_list(COMPLEX_OPERATORS,
+        assertions.string_in_list(_COMPLEX_OPERATORS_IDX,
                                   'wand.image.COMPLEX_OPERATORS',
                                   operator=operator)
         if snr is not None:
             key = b'complex:snr=float'
             val = to_bytes(snr)
             library.MagickSetImageArtifact(self.wand, key, val)
-        operator_idx = COMPLEX_OPERATORS.index(operator)
+        operator_idx = _COMPLEX_OPERATORS_IDX[operator]
         wand = library.MagickComplexImages(self.wand, operator_idx)
         if not bool(wand):
             self.raise_exception()
@@ -4041,7 +4462,7 @@ class BaseImage(Resource):
             left = 0
         assertions.assert_integer(left=left, top=top)
         try:
-            op = COMPOSITE_OPERATORS.index(operator)
+            op = _COMPOSITE_OPERATORS_IDX[operator]
         except IndexError:
             raise ValueError(repr(operator) + ' is an invalid composite '
                              'operator type; see wand.image.COMPOSITE_'
@@ -4066,6 +4487,31 @@ class BaseImage(Resource):
                                              int(left), int(top))
         return r
 
+    @trap_exception
+    def _composite_fast(self, image_wand, left, top, op=_COMPOSITE_OVER):
+        """Internal variant of :meth:`composite()` for callers that already
+        hold validated arguments.  It skips gravity resolution, argument
+        checks, and operator lookup.
+
+        :param image_wand: the wand of the image to place on top
+        :type image_wand: :class:`ctypes.c_void_p`
+        :param left: the x-coordinate, already validated
+        :type left: :class:`int`
+        :param top: the y-coordinate, already validated
+        :type top: :class:`int`
+        :param op: the :const:`COMPOSITE_OPERATORS` index.
+                   default is ``'over'``
+        :type op: :class:`int`
+
+        .. versionadded:: 0.7.0
+        """
+        if MAGICK_VERSION_NUMBER < 0x700:
+            return library.MagickCompositeImage(self.wand, image_wand, op,
+                                                left, top)
+        else:  # pragma: no cover
+            return library.MagickCompositeImage(self.wand, image_wand, op,
+                                                True, left, top)
+
     @manipulative
     @trap_exception
     def composite_channel(self, channel, image, operator, left=None, top=None,
@@ -4120,7 +4566,7 @@ class BaseImage(Resource):
             left = 0
         assertions.assert_integer(left=left, top=top)
         try:
-            op = COMPOSITE_OPERATORS.index(operator)
+            op = _COMPOSITE_OPERATORS_IDX[operator]
         except IndexError:
             raise IndexError(repr(operator) + ' is an invalid composite '
                              'operator type; see wand.image.COMPOSITE_'
@@ -4606,12 +5052,14 @@ class BaseImage(Resource):
         def abs_(n, m, null=None):
             if n is None:
                 return m if null is None else null
-            elif not isinstance(n, numbers.Integral):
+            elif not (isinstance(n, int) or
+                      isinstance(n, numbers.Integral)):
                 raise TypeError('expected integer, not ' + repr(n))
             elif n > m:
                 raise ValueError(repr(n) + ' > ' + repr(m))
             return m + n if n < 0 else n
 
+        image_width, image_height = self.size
         # Define left & top if gravity is given.
         if gravity:
             if width is None or height is None:
@@ -4620,20 +5068,20 @@ class BaseImage(Resource):
                 )
             top, left = self._gravity_to_offset(gravity, width, height)
         else:
-            left = abs_(left, self.width, 0)
-            top = abs_(top, self.height, 0)
+            left = abs_(left, image_width, 0)
+            top = abs_(top, image_height, 0)
 
         if width is None:
-            right = abs_(right, self.width)
+            right = abs_(right, image_width)
             width = right - left
         if height is None:
-            bottom = abs_(bottom, self.height)
+            bottom = abs_(bottom, image_height)
             height = bottom - top
         assertions.assert_counting_number(width=width, height=height)
         if (
             left == top == 0 and
-            width == self.width and
-            height == self.height
+            width == image_width and
+            height == image_height
         ):
             return True
         if self.animation:
@@ -4728,6 +5176,16 @@ class BaseImage(Resource):
         """
         return library.MagickDespeckleImage(self.wand)
 
+    def destroy(self):
+        """Cleans up the image, and the internal pixel iterator cached for
+        reading single pixels.
+
+        .. versionchanged:: 0.7.0
+           Also destroys the cached pixel iterator.
+        """
+        self._pixel_iterator = None
+        super().destroy()
+
     @manipulative
     @trap_exception
     def distort(self, method, arguments, best_fit=False, filter=None):
@@ -4783,22 +5241,23 @@ class BaseImage(Resource):
         .. versionchanged:: 0.6.11
            Included `filter=` parameter.
         """
-        assertions.string_in_list(DISTORTION_METHODS,
+        assertions.string_in_list(_DISTORTION_METHODS_IDX,
                                   'wand.image.DISTORTION_METHODS',
                                   method=method)
         if not isinstance(arguments, abc.Sequence):
             raise TypeError('expected sequence of doubles, not ' +
                             repr(arguments))
-        argc = len(arguments)
-        argv = (ctypes.c_double * argc)(*arguments)
-        method_idx = DISTORTION_METHODS.index(method)
+        values = array.array('d', arguments)
+        argc = len(values)
+        argv = (ctypes.c_double * argc).from_buffer(values)
+        method_idx = _DISTORTION_METHODS_IDX[method]
         if filter is not None:
-            assertions.string_in_list(FILTER_TYPES,
+            assertions.string_in_list(_FILTER_TYPES_IDX,
                                       'wand.image.FILTER_TYPES',
                                       filter=filter)
             ok = False
             if library.MagickSetImageFilter:
-                filter_idx = FILTER_TYPES.index(filter)
+                filter_idx = _FILTER_TYPES_IDX[filter]
                 ok = library.MagickSetImageFilter(self.wand,
                                                   filter_idx)
             else:
@@ -4939,10 +5398,10 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.4.1
         """
-        assertions.string_in_list(EVALUATE_OPS, 'wand.image.EVALUATE_OPS',
+        assertions.string_in_list(_EVALUATE_OPS_IDX, 'wand.image.EVALUATE_OPS',
                                   operator=operator)
         assertions.assert_real(value=value)
-        idx_op = EVALUATE_OPS.index(operator)
+        idx_op = _EVALUATE_OPS_IDX[operator]
         if channel is None:
             r = library.MagickEvaluateImage(self.wand, idx_op, value)
         else:
@@ -4979,17 +5438,18 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.7.0
         """
-        assertions.string_in_list(EVALUATE_OPS, 'wand.image.EVALUATE_OPS',
+        assertions.string_in_list(_EVALUATE_OPS_IDX, 'wand.image.EVALUATE_OPS',
                                   operator=operator)
         self.iterator_reset()
-        idx_op = EVALUATE_OPS.index(operator)
+        idx_op = _EVALUATE_OPS_IDX[operator]
         result = library.MagickEvaluateImages(self.wand, idx_op)
         if not result:
             self.raise_exception()
         return Image(image=BaseImage(result))
 
     def export_pixels(self, x=0, y=0, width=None, height=None,
-                      channel_map="RGBA", storage='char'):
+                      channel_map="RGBA", storage='char',
+                      as_memoryview=False):
         """Export pixel data from a raster image to
         a list of values.
 
@@ -5040,6 +5500,12 @@ class BaseImage(Resource):
         :param storage: what data type each value should
                         be calculated as.
         :type storage: :class:`str`
+        :param as_memoryview: return the exported buffer itself as a
+                              :class:`memoryview` shaped
+                              ``(height, width, len(channel_map))``
+                              instead of copying it into a list.
+                              Defaults to ``False``.
+        :type as_memoryview: :class:`bool`
         :returns: list of values.
         :rtype: :class:`collections.abc.Sequence`
 
@@ -5047,6 +5513,9 @@ class BaseImage(Resource):
 
         .. versionchanged:: 0.6.11
            Update storage type size for `"long"` & `"quantum"` values.
+
+        .. versionchanged:: 0.7.0
+           Added ``as_memoryview`` parameter.
         """
         _w, _h = self.size
         if width is None:
@@ -5055,7 +5524,8 @@ class BaseImage(Resource):
             height = _h
         assertions.assert_integer(x=x, y=y, width=width, height=height)
         assertions.assert_string(channel_map=channel_map)
-        assertions.string_in_list(STORAGE_TYPES, 'wand.image.STORAGE_TYPES',
+        assertions.string_in_list(_STORAGE_TYPES_IDX,
+                                  'wand.image.STORAGE_TYPES',
                                   storage=storage)
         channel_map = channel_map.upper()
         valid_channels = 'RGBAOCYMKIP'
@@ -5063,18 +5533,8 @@ class BaseImage(Resource):
             if channel not in valid_channels:
                 raise ValueError('Unknown channel label: ' +
                                  repr(channel))
-        c_storage_types = [
-            None,                                # undefined
-            ctypes.c_ubyte,                      # char
-            ctypes.c_double,                     # double
-            ctypes.c_float,                      # float
-            ctypes.c_uint,                       # integer
-            ctypes.c_uint64,                     # long
-            library.PixelGetRedQuantum.restype,  # quantum
-            ctypes.c_ushort                      # short
-        ]
-        s_index = STORAGE_TYPES.index(storage)
-        c_storage = c_storage_types[s_index]
+        s_index = _STORAGE_TYPES_IDX[storage]
+        c_storage = _STORAGE_CTYPES[s_index]
         total_pixels = width * height
         c_buffer_size = total_pixels * len(channel_map)
         c_buffer = (c_buffer_size * c_storage)()
@@ -5085,7 +5545,13 @@ class BaseImage(Resource):
                                             ctypes.byref(c_buffer))
         if not r:  # pragma: no cover
             self.raise_exception()
-        return c_buffer[:c_buffer_size]
+        # Unpack through a native memoryview; it builds the list faster
+        # than slicing the ctypes array element by element.
+        view = memoryview(c_buffer).cast('B')
+        if as_memoryview:
+            return view.cast(c_storage._type_,
+                             (height, width, len(channel_map)))
+        return view.cast(c_storage._type_).tolist()
 
     @manipulative
     @trap_exception
@@ -5394,7 +5860,9 @@ class BaseImage(Resource):
            Added optional ``compose`` parameter.
         """
         if matte is None:
-            matte = Color('gray')
+            # Copy the default from a cached structure; a shared Color
+            # instance isn't safe to enter from several threads.
+            matte = _parsed_color('gray')
         if isinstance(matte, str):
             matte = Color(matte)
         assertions.assert_color(matte=matte)
@@ -5408,10 +5876,10 @@ class BaseImage(Resource):
                                              width, height,
                                              inner_bevel, outer_bevel)
             else:  # pragma: no cover
-                assertions.string_in_list(COMPOSITE_OPERATORS,
+                assertions.string_in_list(_COMPOSITE_OPERATORS_IDX,
                                           'wand.image.COMPOSITE_OPERATORS',
                                           compose=compose)
-                op = COMPOSITE_OPERATORS.index(compose)
+                op = _COMPOSITE_OPERATORS_IDX[compose]
                 r = library.MagickFrameImage(self.wand,
                                              matte.resource,
                                              width, height,
@@ -5451,14 +5919,16 @@ class BaseImage(Resource):
 
         .. versionadded:: 0.4.1
         """
-        assertions.string_in_list(FUNCTION_TYPES, 'wand.image.FUNCTION_TYPES',
+        assertions.string_in_list(_FUNCTION_TYPES_IDX,
+                                  'wand.image.FUNCTION_TYPES',
                                   function=function)
         if not isinstance(arguments, abc.Sequence):
             raise TypeError('expecting sequence of arguments, not ' +
                             repr(arguments))
-        argc = len(arguments)
-        argv = (ctypes.c_double * argc)(*arguments)
-        index = FUNCTION_TYPES.index(function)
+        values = array.array('d', arguments)
+        argc = len(values)
+        argv = (ctypes.c_double * argc).from_buffer(values)
+        index = _FUNCTION_TYPES_IDX[function]
         if channel is None:
             r = library.MagickFunctionImage(self.wand, index, argc, argv)
         else:
@@ -5634,10 +6104,10 @@ class BaseImage(Resource):
         """
         if not isinstance(image, BaseImage):
             raise TypeError('expecting a base image, not ' + repr(image))
-        assertions.string_in_list(COMPARE_METRICS,
+        assertions.string_in_list(_COMPARE_METRICS_IDX,
                                   'wand.image.COMPARE_METRICS',
                                   metric=metric)
-        metric_idx = COMPARE_METRICS.index(metric)
+        metric_idx = _COMPARE_METRICS_IDX[metric]
         dist = ctypes.c_double(0.0)
         ok = library.MagickGetImageDistortion(self.wand, image.wand,
                                               metric_idx, dist)
@@ -5739,13 +6209,13 @@ class BaseImage(Resource):
         .. versionadded:: 0.5.2
         """
         assertions.assert_real(amount=amount)
-        assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+        assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                   'wand.image.PIXEL_INTERPOLATE_METHODS',
                                   method=method)
         if MAGICK_VERSION_NUMBER < 0x700:
             r = library.MagickImplodeImage(self.wand, amount)
         else:  # pragma: no cover
-            method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+            method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
             r = library.MagickImplodeImage(self.wand, amount, method_idx)
         return r
 
@@ -5803,11 +6273,21 @@ class BaseImage(Resource):
         :param storage: what data type each value should
                         be calculated as.
         :type storage: :class:`str`
+        :param data: the values to import.  An object supporting the
+                     buffer protocol, e.g. :class:`array.array`, a
+                     :mod:`ctypes` array, or a NumPy array, whose item
+                     format matches ``storage`` is read without being
+                     copied into a new buffer.
+        :type data: :class:`collections.abc.Sequence`
 
         .. versionadded:: 0.5.0
 
         .. versionchanged:: 0.6.11
            Update storage type size for `"long"` & `"quantum"` values.
+
+        .. versionchanged:: 0.7.0
+           Accept any C-contiguous buffer matching ``storage``, including
+           a :mod:`ctypes` array, as ``data``.
         """
         _w, _h = self.size
         if width is None:
@@ -5815,7 +6295,8 @@ class BaseImage(Resource):
         if height is None:
             height = _h
         assertions.assert_integer(x=x, y=y, width=width, height=height)
-        assertions.string_in_list(STORAGE_TYPES, 'wand.image.STORAGE_TYPES',
+        assertions.string_in_list(_STORAGE_TYPES_IDX,
+                                  'wand.image.STORAGE_TYPES',
                                   storage=storage)
         assertions.assert_string(channel_map=channel_map)
         channel_map = channel_map.upper()
@@ -5824,31 +6305,57 @@ class BaseImage(Resource):
             if channel not in valid_channels:
                 raise ValueError('Unknown channel label: ' +
                                  repr(channel))
-        if not isinstance(data, abc.Sequence):
+        s_index = _STORAGE_TYPES_IDX[storage]
+        c_type = _STORAGE_CTYPES[s_index]
+        if isinstance(data, ctypes.Array) and data._type_ is c_type:
+            # ctypes reports its formats with an explicit byte order; view
+            # the array with the native format instead.
+            view = memoryview(data).cast('B').cast(c_type._type_)
+        else:
+            try:
+                view = memoryview(data)
+            except TypeError:
+                view = None
+            else:
+                # Only a contiguous buffer of the storage type itself can be
+                # handed to the library as is.
+                if view.format != c_type._type_ or not view.c_contiguous:
+                    view = None
+        if view is None and not isinstance(data, abc.Sequence):
             raise TypeError('data must list of values, not' +
                             repr(data))
         # Ensure enough data was given.
         expected_len = width * height * len(channel_map)
-        given_len = len(data)
+        if view is None:
+            given_len = len(data)
+        else:
+            given_len = view.nbytes // view.itemsize
         if expected_len != given_len:
             msg = 'data length should be {0}, not {1}.'.format(
                 expected_len,
                 given_len
             )
             raise ValueError(msg)
-        c_storage_types = [
-            None,                                # undefined
-            ctypes.c_ubyte,                      # char
-            ctypes.c_double,                     # double
-            ctypes.c_float,                      # float
-            ctypes.c_uint,                       # integer
-            ctypes.c_uint64,                     # long
-            library.PixelGetRedQuantum.restype,  # quantum
-            ctypes.c_ushort                      # short
-        ]
-        s_index = STORAGE_TYPES.index(storage)
-        c_type = c_storage_types[s_index]
-        c_buffer = (len(data) * c_type)(*data)
+        if view is not None:
+            c_buffer_type = given_len * c_type
+            if view.readonly:
+                c_buffer = c_buffer_type.from_buffer_copy(view)
+            else:
+                c_buffer = c_buffer_type.from_buffer(view)
+        else:
+            if isinstance(data, (bytes, bytearray)):
+                # array.array() copies bytes-like initializers verbatim;
+                # iterate them instead, so each byte is still one value.
+                data = memoryview(data)
+            try:
+                # Pack the values in C, and share the buffer with ctypes,
+                # instead of passing every value as an argument.
+                values = array.array(c_type._type_, data)
+            except OverflowError:
+                # ctypes silently wraps out of range integers; keep it.
+                c_buffer = (len(data) * c_type)(*data)
+            else:
+                c_buffer = (len(values) * c_type).from_buffer(values)
         r = library.MagickImportImagePixels(self.wand,
                                             x, y, width, height,
                                             binary(channel_map),
@@ -6102,7 +6609,7 @@ class BaseImage(Resource):
         if font is not None and not isinstance(font, Font):
             raise TypeError('font must be a wand.font.Font, not ' + repr(font))
         if gravity is not None:
-            assertions.string_in_list(GRAVITY_TYPES,
+            assertions.string_in_list(_GRAVITY_TYPES_IDX,
                                       'wand.image.GRAVITY_TYPES',
                                       gravity=gravity)
         if font is None:
@@ -6522,7 +7029,7 @@ class BaseImage(Resource):
         if method not in ('merge', 'flatten', 'mosaic', 'trimbounds'):
             raise ValueError('method can only be \'merge\', \'flatten\', '
                              '\'mosaic\', or \'trimbounds\'')
-        m = IMAGE_LAYER_METHOD.index(method)
+        m = _IMAGE_LAYER_METHOD_IDX[method]
         r = library.MagickMergeImageLayers(self.wand, m)
         if r:
             self.wand = r
@@ -6719,13 +7226,13 @@ class BaseImage(Resource):
         builtin = None
         geometry = ''
         parts = kernel.split(':')
-        if parts[0] in KERNEL_INFO_TYPES:
+        if parts[0] in _KERNEL_INFO_TYPES_IDX:
             builtin = parts[0]
             if len(parts) == 2:
                 geometry = parts[1]
         exception_info = libmagick.AcquireExceptionInfo()
         if builtin:
-            kernel_idx = KERNEL_INFO_TYPES.index(builtin)
+            kernel_idx = _KERNEL_INFO_TYPES_IDX[builtin]
             geometry_info = GeometryInfo()
             flags = libmagick.ParseGeometry(binary(geometry),
                                             ctypes.byref(geometry_info))
@@ -6783,7 +7290,7 @@ class BaseImage(Resource):
         r = None
         exception_info = libmagick.DestroyExceptionInfo(exception_info)
         if kernel_info:
-            method_idx = MORPHOLOGY_METHODS.index(method)
+            method_idx = _MORPHOLOGY_METHODS_IDX[method]
             if channel is None:
                 r = library.MagickMorphologyImage(self.wand, method_idx,
                                                   iterations, kernel_info)
@@ -6897,10 +7404,10 @@ class BaseImage(Resource):
         .. versionchanged:: 0.5.5
            Added optional ``channel`` argument.
         """
-        assertions.string_in_list(NOISE_TYPES, 'wand.image.NOISE_TYPES',
+        assertions.string_in_list(_NOISE_TYPES_IDX, 'wand.image.NOISE_TYPES',
                                   noise_type=noise_type)
         assertions.assert_real(attenuate=attenuate)
-        noise_type_idx = NOISE_TYPES.index(noise_type)
+        noise_type_idx = _NOISE_TYPES_IDX[noise_type]
         if MAGICK_VERSION_NUMBER < 0x700:
             if channel is None:
                 r = library.MagickAddNoiseImage(self.wand, noise_type_idx)
@@ -6932,6 +7439,9 @@ class BaseImage(Resource):
                         normalize all channels.
         :type channel: :class:`str`
 
+        .. versionchanged:: 0.7.0
+           Normalizing a single channel with ImageMagick-7 works on the
+           image in-place, instead of on a copy composited back.
         """
         if channel is None:
             r = library.MagickNormalizeImage(self.wand)
@@ -6940,22 +7450,12 @@ class BaseImage(Resource):
             if library.MagickNormalizeImageChannel:
                 r = library.MagickNormalizeImageChannel(self.wand, ch_const)
             else:  # pragma: no cover
-                with Image(image=self) as mask:
-                    # Set active channel, and capture mask to restore.
-                    channel_mask = library.MagickSetImageChannelMask(mask.wand,
-                                                                     ch_const)
-                    r = library.MagickNormalizeImage(mask.wand)
-                    # Restore original state of channels.
-                    library.MagickSetImageChannelMask(mask.wand,
-                                                      channel_mask)
-                    # Copy adjusted mask over original value.
-                    copy_mask = COMPOSITE_OPERATORS.index('copy_' + channel)
-                    library.MagickCompositeImage(self.wand,
-                                                 mask.wand,
-                                                 copy_mask,
-                                                 False,
-                                                 0,
-                                                 0)
+                # Set active channel, and capture mask to restore.
+                channel_mask = library.MagickSetImageChannelMask(self.wand,
+                                                                 ch_const)
+                r = library.MagickNormalizeImage(self.wand)
+                # Restore original state of channels
+                library.MagickSetImageChannelMask(self.wand, channel_mask)
         return r
 
     @manipulative
@@ -7242,7 +7742,7 @@ class BaseImage(Resource):
         .. versionadded:: 0.5.4
         """
         assertions.assert_real(angle=angle)
-        assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+        assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                   'wand.image.PIXEL_INTERPOLATE_METHODS',
                                   method=method)
         ctx_ptr = library.NewDrawingWand()
@@ -7272,7 +7772,7 @@ class BaseImage(Resource):
         if MAGICK_VERSION_NUMBER < 0x700:
             r = library.MagickPolaroidImage(self.wand, ctx_ptr, angle)
         else:  # pragma: no cover
-            method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+            method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
             r = library.MagickPolaroidImage(self.wand, ctx_ptr, caption, angle,
                                             method_idx)
         ctx_ptr = library.DestroyDrawingWand(ctx_ptr)
@@ -7348,9 +7848,10 @@ class BaseImage(Resource):
         .. versionadded:: 0.5.0
         """
         assertions.assert_integer(levels=levels)
-        assertions.string_in_list(DITHER_METHODS, 'wand.image.DITHER_METHODS',
+        assertions.string_in_list(_DITHER_METHODS_IDX,
+                                  'wand.image.DITHER_METHODS',
                                   dither=dither)
-        dither_idx = DITHER_METHODS.index(dither)
+        dither_idx = _DITHER_METHODS_IDX[dither]
         return library.MagickPosterizeImage(self.wand, levels, dither_idx)
 
     @manipulative
@@ -7392,10 +7893,10 @@ class BaseImage(Resource):
            is now set to ``"undefeined"`` to match CLI behavior.
         """
         assertions.assert_integer(number_colors=number_colors)
-        assertions.string_in_list(COLORSPACE_TYPES,
+        assertions.string_in_list(_COLORSPACE_TYPES_IDX,
                                   'wand.image.COLORSPACE_TYPES',
                                   colorspace_type=colorspace_type)
-        colorspace_type = COLORSPACE_TYPES.index(colorspace_type)
+        colorspace_type = _COLORSPACE_TYPES_IDX[colorspace_type]
         assertions.assert_integer(treedepth=treedepth)
         if MAGICK_VERSION_NUMBER < 0x700:
             assertions.assert_bool(dither=dither)
@@ -7404,10 +7905,10 @@ class BaseImage(Resource):
                 dither = 'no'
             elif dither is True:
                 dither = 'riemersma'
-            assertions.string_in_list(DITHER_METHODS,
+            assertions.string_in_list(_DITHER_METHODS_IDX,
                                       'wand.image.DITHER_METHODS',
                                       dither=dither)
-            dither = DITHER_METHODS.index(dither)
+            dither = _DITHER_METHODS_IDX[dither]
         assertions.assert_bool(measure_error=measure_error)
         return library.MagickQuantizeImage(
             self.wand, number_colors, colorspace_type,
@@ -7656,9 +8157,10 @@ class BaseImage(Resource):
         if not isinstance(affinity, BaseImage):
             raise TypeError('Expecting affinity to be a BaseImage, not ' +
                             repr(affinity))
-        assertions.string_in_list(DITHER_METHODS, 'wand.image.DITHER_METHODS',
+        assertions.string_in_list(_DITHER_METHODS_IDX,
+                                  'wand.image.DITHER_METHODS',
                                   method=method)
-        method_idx = DITHER_METHODS.index(method)
+        method_idx = _DITHER_METHODS_IDX[method]
         return library.MagickRemapImage(self.wand, affinity.wand, method_idx)
 
     @manipulative
@@ -7717,7 +8219,7 @@ class BaseImage(Resource):
                             'FILTER_TYPES or an integer, not ' + repr(filter))
         if isinstance(filter, str):
             try:
-                filter = FILTER_TYPES.index(filter)
+                filter = _FILTER_TYPES_IDX[filter]
             except IndexError:
                 raise ValueError(repr(filter) + ' is an invalid filter type; '
                                  'choose on in ' + repr(FILTER_TYPES))
@@ -7798,7 +8300,7 @@ class BaseImage(Resource):
                             'FILTER_TYPES or an integer, not ' + repr(filter))
         if isinstance(filter, str):
             try:
-                filter = FILTER_TYPES.index(filter)
+                filter = _FILTER_TYPES_IDX[filter]
             except IndexError:
                 raise ValueError(repr(filter) + ' is an invalid filter type; '
                                  'choose on in ' + repr(FILTER_TYPES))
@@ -8316,10 +8818,10 @@ class BaseImage(Resource):
                                               ctypes.byref(rio),
                                               ctypes.byref(diff))
         else:  # pragma: no cover
-            assertions.string_in_list(COMPARE_METRICS,
+            assertions.string_in_list(_COMPARE_METRICS_IDX,
                                       'wand.image.COMPARE_METRICS',
                                       metric=metric)
-            metric_idx = COMPARE_METRICS.index(metric)
+            metric_idx = _COMPARE_METRICS_IDX[metric]
             r = library.MagickSimilarityImage(self.wand,
                                               reference.wand,
                                               metric_idx,
@@ -8583,10 +9085,10 @@ class BaseImage(Resource):
            Added default value to ``radius``.
         """
         assertions.assert_real(radius=radius)
-        assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+        assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                   'wand.image.PIXEL_INTERPOLATE_METHODS',
                                   method=method)
-        method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+        method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
         if MAGICK_VERSION_NUMBER < 0x700:
             r = library.MagickSpreadImage(self.wand, radius)
         else:  # pragma: no cover
@@ -8619,11 +9121,11 @@ class BaseImage(Resource):
         .. versionchanged:: 0.5.5
            Added optional ``channel`` argument.
         """
-        assertions.string_in_list(STATISTIC_TYPES,
+        assertions.string_in_list(_STATISTIC_TYPES_IDX,
                                   'wand.image.STATISTIC_TYPES',
                                   statistic=stat)
         assertions.assert_integer(width=width, height=height)
-        stat_idx = STATISTIC_TYPES.index(stat)
+        stat_idx = _STATISTIC_TYPES_IDX[stat]
         if channel is None:
             r = library.MagickStatisticImage(self.wand, stat_idx,
                                              width, height)
@@ -8711,10 +9213,10 @@ class BaseImage(Resource):
         if MAGICK_VERSION_NUMBER < 0x700:
             r = library.MagickSwirlImage(self.wand, degree)
         else:  # pragma: no cover
-            assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+            assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                       'wand.image.PIXEL_INTERPOLATE_METHODS',
                                       method=method)
-            method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+            method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
             r = library.MagickSwirlImage(self.wand, degree, method_idx)
         return r
 
@@ -9010,12 +9512,12 @@ class BaseImage(Resource):
         .. versionadded:: 0.4.2
 
         """
-        assertions.string_in_list(COLORSPACE_TYPES,
+        assertions.string_in_list(_COLORSPACE_TYPES_IDX,
                                   'wand.image.COLORSPACE_TYPES',
                                   colorspace=colorspace_type)
         return library.MagickTransformImageColorspace(
             self.wand,
-            COLORSPACE_TYPES.index(colorspace_type)
+            _COLORSPACE_TYPES_IDX[colorspace_type]
         )
 
     @manipulative
@@ -9088,7 +9590,7 @@ class BaseImage(Resource):
             else:  # pragma: no cover
                 image_type = 'truecoloralpha'
             library.MagickSetImageType(self.wand,
-                                       IMAGE_TYPES.index(image_type))
+                                       _IMAGE_TYPES_IDX[image_type])
             # Perform the black channel subtraction
             self.evaluate(operator='subtract',
                           value=t.value,
@@ -9330,13 +9832,13 @@ class BaseImage(Resource):
         .. versionadded:: 0.5.2
         """
         assertions.assert_real(amplitude=amplitude, wave_length=wave_length)
-        assertions.string_in_list(PIXEL_INTERPOLATE_METHODS,
+        assertions.string_in_list(_PIXEL_INTERPOLATE_METHODS_IDX,
                                   'wand.image.PIXEL_INTERPOLATE_METHODS',
                                   method=method)
         if MAGICK_VERSION_NUMBER < 0x700:
             r = library.MagickWaveImage(self.wand, amplitude, wave_length)
         else:  # pragma: no cover
-            method_idx = PIXEL_INTERPOLATE_METHODS.index(method)
+            method_idx = _PIXEL_INTERPOLATE_METHODS_IDX[method]
             r = library.MagickWaveImage(self.wand, amplitude, wave_length,
                                         method_idx)
         return r
@@ -9520,6 +10022,25 @@ class Image(BaseImage):
     .. versionchanged:: 0.6.3
        Added ``sampling_factors`` parameter for working with YUV streams.
 
+    .. note::
+
+       The MagickWand library is loaded with :class:`ctypes.CDLL`, so the
+       :term:`GIL` is released for the duration of every library call,
+       including long running pixel imports & exports.  Threads working on
+       *different* images therefore run in parallel.  A single
+       :class:`Image` isn't thread-safe though; don't share one instance
+       between threads without a lock.  For example::
+
+           from concurrent.futures import ThreadPoolExecutor
+
+           def thumbnail(filename):
+               with Image(filename=filename) as img:
+                   img.transform(resize='128x128>')
+                   img.save(filename='thumb-' + filename)
+
+           with ThreadPoolExecutor() as executor:
+               executor.map(thumbnail, filenames)
+
     .. describe:: [left:right, top:bottom]
 
        Crops the image by its ``left``, ``right``, ``top`` and ``bottom``,
@@ -9635,10 +10156,8 @@ class Image(BaseImage):
             self.profiles = ProfileDict(self)
         self.raise_exception()
 
-    def __repr__(self):
-        return super().__repr__(
-            extra_format=' {self.format!r} ({self.width}x{self.height})'
-        )
+    def _repr_extra(self):
+        return ' %r (%dx%d)' % (self.format, self.width, self.height)
 
     def _preamble_read(self, background=None, colorspace=None, depth=None,
                        extract=None, format=None, height=None, interlace=None,
@@ -9688,11 +10207,11 @@ class Image(BaseImage):
                                                  background.resource)
         if colorspace is not None:
             assertions.string_in_list(
-                COLORSPACE_TYPES,
+                _COLORSPACE_TYPES_IDX,
                 'wand.image.COLORSPACE_TYPES',
                 colorspace=colorspace
             )
-            colorspace_idx = COLORSPACE_TYPES.index(colorspace)
+            colorspace_idx = _COLORSPACE_TYPES_IDX[colorspace]
             library.MagickSetColorspace(self.wand, colorspace_idx)
         if depth is not None:
             assertions.assert_counting_number(depth=depth)
@@ -9706,11 +10225,11 @@ class Image(BaseImage):
             library.MagickSetFilename(self.wand, b'buffer.' + binary(format))
         if interlace is not None:
             assertions.string_in_list(
-                INTERLACE_TYPES,
+                _INTERLACE_TYPES_IDX,
                 'wand.image.INTERLACE_TYPES',
                 interlace=interlace
             )
-            c_interlace = INTERLACE_TYPES.index(interlace)
+            c_interlace = _INTERLACE_TYPES_IDX[interlace]
             library.MagickSetInterlaceScheme(self.wand, c_interlace)
         if resolution is not None:
             if (isinstance(resolution, abc.Sequence) and
@@ -9811,7 +10330,7 @@ class Image(BaseImage):
             data_ptr = array.tostring()
         else:
             data_ptr, _ = arr_itr.get('data')
-        storage_idx = STORAGE_TYPES.index(storage)
+        storage_idx = _STORAGE_TYPES_IDX[storage]
         height, width = shape[:2]
         genesis()
         wand = library.NewMagickWand()
@@ -9963,6 +10482,7 @@ class Image(BaseImage):
                                        background.resource)
             if not r:
                 self.raise_exception()
+        self._touch()
         return self
 
     def clear(self):
@@ -9973,6 +10493,7 @@ class Image(BaseImage):
 
         """
         library.ClearMagickWand(self.wand)
+        self._touch()
 
     def close(self):
         """Closes the image explicitly. If you use the image object in
@@ -10014,7 +10535,7 @@ class Image(BaseImage):
             raise ValueError('method can only be \'compareany\', '
                              '\'compareclear\', or \'compareoverlay\'')
         r = None
-        m = IMAGE_LAYER_METHOD.index(method)
+        m = _IMAGE_LAYER_METHOD_IDX[method]
         if MAGICK_VERSION_NUMBER >= 0x700:  # pragma: no cover
             r = library.MagickCompareImagesLayers(self.wand, m)
         elif library.MagickCompareImageLayers:
@@ -10236,7 +10757,7 @@ class Image(BaseImage):
         assertions.in_list(MONTAGE_MODES,
                            'wand.image.MONTAGE_MODES',
                            mode=mode)
-        mode_idx = MONTAGE_MODES.index(mode)
+        mode_idx = _MONTAGE_MODES_IDX[mode]
         if frame is not None:
             assertions.assert_string(frame=frame)
             frame = binary(frame)
@@ -10310,6 +10831,7 @@ class Image(BaseImage):
         r = library.MagickReadImage(self.wand, encode_filename(pseudo))
         if not r:
             self.raise_exception()
+        self._touch()
 
     def read(self, file=None, filename=None, blob=None, background=None,
              colorspace=None, depth=None, extract=None, format=None,
@@ -10403,6 +10925,7 @@ class Image(BaseImage):
                    'raster.')
             raise WandRuntimeError(msg)
         else:
+            self._touch()
             if units is not None:
                 self.units = units
 
@@ -10493,11 +11016,18 @@ class Iterator(Resource, abc.Iterator):
     Every row is a :class:`collections.abc.Sequence` which consists of
     one or more :class:`wand.color.Color` values.
 
+    Calling ``iterator.__next__(raw=True)`` instead returns the row as
+    a two-dimensional :class:`memoryview` of ``(width, c_packet_size)``
+    bytes, which skips building :class:`~wand.color.Color` objects.
+
     :param image: the image to get an iterator
     :type image: :class:`Image`
 
     .. versionadded:: 0.1.3
 
+    .. versionchanged:: 0.7.0
+       Added ``raw`` parameter to :meth:`__next__`.
+
     """
 
     c_is_resource = library.IsPixelIterator
@@ -10505,6 +11035,12 @@ class Iterator(Resource, abc.Iterator):
     c_get_exception = library.PixelGetIteratorException
     c_clear_exception = library.PixelClearIteratorException
 
+    #: (:class:`numbers.Integral`) The size of the pixel structure copied
+    #: into each :class:`~wand.color.Color` of a row.
+    #:
+    #: .. versionadded:: 0.7.0
+    c_packet_size = Color.c_packet_size
+
     def __init__(self, image=None, iterator=None):
         if image is not None and iterator is not None:
             raise TypeError('it takes only one argument at a time')
@@ -10528,8 +11064,17 @@ class Iterator(Resource, abc.Iterator):
         return self
 
     def seek(self, y):
-        assertions.assert_unsigned_integer(seek=y)
-        if y > self.height:
+        # Use the index protocol rather than an isinstance() check against
+        # numbers.Integral, as seeking may happen on every row.
+        try:
+            y = y.__index__()
+        except AttributeError:
+            raise TypeError('seek must be an integer, not ' + repr(y))
+        if not 0 <= y <= self.height:
+            if y < 0:
+                raise ValueError(
+                    'seek={0} must be a positive integer'.format(y)
+                )
             raise ValueError('can not be greater than height')
         self.cursor = y
         if y == 0:
@@ -10538,7 +11083,7 @@ class Iterator(Resource, abc.Iterator):
             if not library.PixelSetIteratorRow(self.resource, y - 1):
                 self.raise_exception()
 
-    def __next__(self, x=None):
+    def __next__(self, x=None, raw=False):
         if self.cursor >= self.height:
             self.destroy()
             raise StopIteration()
@@ -10547,10 +11092,25 @@ class Iterator(Resource, abc.Iterator):
         pixels = library.PixelGetNextIteratorRow(self.resource,
                                                  ctypes.byref(width))
         if x is None:
-            r_pixels = [None] * width.value
-            for x in range(width.value):
-                r_pixels[x] = Color.from_pixelwand(pixels[x])
-            return r_pixels
+            row_width = width.value
+            packet_size = self.c_packet_size
+            if raw:
+                # Copy every pixel structure into one contiguous buffer,
+                # and skip building Color objects entirely.
+                buffer = bytearray(packet_size * row_width)
+                packet_type = ctypes.c_char * packet_size
+                for x in range(row_width):
+                    packet = packet_type.from_buffer(buffer, x * packet_size)
+                    library.PixelGetMagickColor(pixels[x], packet)
+                return memoryview(buffer).cast('B', (row_width, packet_size))
+            # Allocate a single buffer for the whole row, and let each color
+            # reference its own slice of it.
+            slab = ctypes.create_string_buffer(packet_size * row_width)
+            for x in range(row_width):
+                library.PixelGetMagickColor(
+                    pixels[x], ctypes.byref(slab, x * packet_size)
+                )
+            return Color.from_packets_buffer(slab, row_width)
         return Color.from_pixelwand(pixels[x]) if pixels else None
 
     def clone(self):
@@ -10613,13 +11173,11 @@ class OptionDict(ImageProperty, abc.MutableMapping):
 
     def __getitem__(self, key):
         assertions.assert_string(key=key)
-        opt_str = b''
         opt_p = library.MagickGetOption(self.image.wand, binary(key))
-        if opt_p:
-            opt_str = text(ctypes.string_at(opt_p))
-            opt_p = library.MagickRelinquishMemory(opt_p)
-        else:
+        if not opt_p:
             raise KeyError(key)
+        opt_str = text(ctypes.string_at(opt_p))
+        opt_p = library.MagickRelinquishMemory(opt_p)
         return opt_str
 
     def __setitem__(self, key, value):
@@ -10850,10 +11408,12 @@ class ProfileDict(ImageProperty, abc.MutableMapping):
 
     def __delitem__(self, k):
         assertions.assert_string(key=k)
+        image = self.image
         num = ctypes.c_size_t(0)
-        profile_p = library.MagickRemoveImageProfile(self.image.wand,
+        profile_p = library.MagickRemoveImageProfile(image.wand,
                                                      binary(k), num)
         profile_p = library.MagickRelinquishMemory(profile_p)
+        image._touch()
 
     def __getitem__(self, k):
         assertions.assert_string(key=k)
@@ -10883,10 +11443,12 @@ class ProfileDict(ImageProperty, abc.MutableMapping):
         assertions.assert_string(key=k)
         if not isinstance(v, bytes):
             raise TypeError('value must be a binary string, not ' + repr(v))
-        r = library.MagickSetImageProfile(self.image.wand,
+        image = self.image
+        r = library.MagickSetImageProfile(image.wand,
                                           binary(k), v, len(v))
+        image._touch()
         if not r:
-            self.image.raise_exception()
+            image.raise_exception()
 
 
 class ChannelImageDict(ImageProperty, abc.Mapping):
@@ -10903,8 +11465,17 @@ class ChannelImageDict(ImageProperty, abc.Mapping):
 
     .. versionadded:: 0.3.0
 
+    .. versionchanged:: 0.7.0
+       Added :meth:`extract_channel_raw()` method.
+
     """
 
+    #: (:class:`dict`) Map of :const:`CHANNELS` names to the single-letter
+    #: ``channel_map`` understood by :c:func:`MagickExportImagePixels`.
+    _export_maps = dict(red=b'R', gray=b'I', cyan=b'C', green=b'G',
+                        magenta=b'M', blue=b'B', yellow=b'Y', alpha=b'A',
+                        opacity=b'O', black=b'K')
+
     def __iter__(self):
         return iter(CHANNELS)
 
@@ -10913,6 +11484,8 @@ class ChannelImageDict(ImageProperty, abc.Mapping):
 
     def __getitem__(self, channel):
         c = CHANNELS[channel]
+        # Cloning is cheap here as ImageMagick shares the pixel cache between
+        # both wands until the separate operation writes to it.
         img = self.image.clone()
         if library.MagickSeparateImageChannel:
             succeeded = library.MagickSeparateImageChannel(img.wand, c)
@@ -10926,6 +11499,50 @@ class ChannelImageDict(ImageProperty, abc.Mapping):
                 raise
         return img
 
+    def extract_channel_raw(self, channel):
+        """Exports the 8-bit values of a single ``channel`` directly from the
+        parent image. Unlike :meth:`__getitem__`, the image is not cloned, and
+        no new :class:`Image` is created.
+
+        .. code::
+
+            with Image(filename='rose:') as img:
+                red = img.channel_images.extract_channel_raw('red')
+                print(red.shape)  #=> (46, 70)
+                print(red[0, 0])  # value of the top-left pixel.
+
+        The returned :class:`memoryview` supports the buffer protocol, so it
+        can also be wrapped by :mod:`numpy` without copying the data.
+
+        :param channel: the channel to export. See :const:`CHANNELS`.
+        :type channel: :class:`str`
+        :returns: unsigned 8-bit values indexed by ``[y, x]``.
+        :rtype: :class:`memoryview`
+        :raises ValueError: if ``channel`` can not be exported as a
+                            single channel.
+
+        .. versionadded:: 0.7.0
+        """
+        assertions.string_in_list(CHANNELS, 'wand.image.CHANNELS',
+                                  channel=channel)
+        channel_map = self._export_maps.get(channel)
+        if channel_map is None:
+            raise ValueError('channel ' + repr(channel) + ' can not be '
+                             'exported as a single channel')
+        image = self.image
+        width, height = image.size
+        buffer = bytearray(width * height)
+        c_buffer = (ctypes.c_char * len(buffer)).from_buffer(buffer)
+        r = library.MagickExportImagePixels(image.wand,
+                                            0, 0, width, height,
+                                            channel_map,
+                                            _STORAGE_CHAR,
+                                            ctypes.byref(c_buffer))
+        del c_buffer
+        if not r:  # pragma: no cover
+            image.raise_exception()
+        return memoryview(buffer).cast('B', (height, width))
+
 
 class ChannelDepthDict(ImageProperty, abc.Mapping):
     """The mapping table of channels to their depth.
@@ -10973,6 +11590,31 @@ class HistogramDict(abc.Mapping):
 
     """
 
+    #: (:class:`slice`) The colorspace field of a color's ``raw`` pixel
+    #: structure.  :c:type:`PixelInfo` begins with the same fields as
+    #: :c:type:`MagickPixelPacket`.
+    #:
+    #: .. versionadded:: 0.7.0
+    _colorspace_field = slice(PixelInfo.colorspace.offset,
+                              PixelInfo.colorspace.offset +
+                              PixelInfo.colorspace.size)
+
+    #: (:class:`slice`) The fuzz field of a color's ``raw`` pixel
+    #: structure.
+    #:
+    #: .. versionadded:: 0.7.0
+    _fuzz_field = slice(PixelInfo.fuzz.offset,
+                        PixelInfo.fuzz.offset + PixelInfo.fuzz.size)
+
+    #: (:class:`slice`) The channel values of a color's ``raw`` pixel
+    #: structure.
+    #:
+    #: .. versionadded:: 0.7.0
+    _channel_fields = (slice(MagickPixelPacket.red.offset,
+                             ctypes.sizeof(MagickPixelPacket))
+                       if MAGICK_VERSION_NUMBER < 0x700 else
+                       slice(PixelInfo.red.offset, PixelInfo.index.offset))
+
     def __init__(self, image):
         self.size = ctypes.c_size_t()
         self.pixels = library.MagickGetImageHistogram(
@@ -10980,6 +11622,7 @@ class HistogramDict(abc.Mapping):
             ctypes.byref(self.size)
         )
         self.counts = None
+        self._lookup = None
 
     def __del__(self):
         if self.pixels:
@@ -11002,7 +11645,37 @@ class HistogramDict(abc.Mapping):
         if isinstance(color, str):
             color = Color(color)
         assertions.assert_color(color=color)
-        return self.counts[color]
+        if self._lookup is None:
+            pack = self._pack
+            self._lookup = dict((pack(c.raw), n)
+                                for c, n in self.counts.items())
+        try:
+            return self._lookup[self._pack(color.raw)]
+        except KeyError:
+            # Fall back to the fuzzy Color comparison.
+            return self.counts[color]
+
+    @classmethod
+    def _pack(cls, raw):
+        """Packs the colorspace, fuzz, and channel values of a color into
+        a tuple of :class:`bytes`, which is much cheaper to build and hash
+        than :attr:`Color.normalized_string
+        <wand.color.Color.normalized_string>`.  It's sliced out of the
+        pixel structure without any library call.  Colors only share a key
+        if they are in the same colorspace, so e.g. a CMYK entry never
+        matches an sRGB color with the same channel values.
+
+        :param raw: the ``raw`` pixel structure of a
+                    :class:`~wand.color.Color`
+        :type raw: :class:`ctypes.Array`
+
+        .. versionadded:: 0.7.0
+
+        """
+        data = raw.raw
+        return (data[cls._colorspace_field],
+                data[cls._fuzz_field],
+                data[cls._channel_fields])
 
     def _build_counts(self):
         self.counts = {}
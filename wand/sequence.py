@@ -147,6 +147,7 @@ class Sequence(ImageProperty, abc.MutableSequence):
                 else:
                     library.MagickRemoveImage(self.image.wand)
                     library.MagickAddImage(self.image.wand, image.wand)
+            self.image._touch()
 
     def __delitem__(self, index):
         if isinstance(index, slice):
@@ -158,6 +159,7 @@ class Sequence(ImageProperty, abc.MutableSequence):
                 library.MagickRemoveImage(self.image.wand)
                 if index < len(self.instances):
                     del self.instances[index]
+            self.image._touch()
 
     def insert(self, index, image):
         try:
@@ -193,6 +195,7 @@ class Sequence(ImageProperty, abc.MutableSequence):
         else:
             with self.index_context(index - 1):
                 library.MagickAddImage(self.image.wand, image.sequence[0].wand)
+        self.image._touch()
         self.instances.insert(index, None)
 
     def append(self, image):
@@ -206,6 +209,7 @@ class Sequence(ImageProperty, abc.MutableSequence):
             library.MagickAddImage(wand, image.sequence[0].wand)
         finally:
             self.current_index = tmp_idx
+        self.image._touch()
         self.instances.append(None)
 
     def extend(self, images, offset=None):
@@ -242,6 +246,7 @@ class Sequence(ImageProperty, abc.MutableSequence):
                         length += 1
         finally:
             self.current_index = tmp_idx
+        self.image._touch()
         null_list = [None] * length
         if offset is None:
             self.instances[offset:] = null_list